@@ -15,15 +15,50 @@ import curses
 import tempfile
 import subprocess
 import platform
+import contextlib
 import threading
 import time
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data):
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=4, ensure_ascii=False)
+
+
+# Sentinel values for questionary menu choices in review_entities and
+# resolve_duplicate_entities; compared by identity so they can never collide
+# with user data such as category names or LLM translation options.
+_EXIT = object()
+_BACK = object()
+_EDIT_ITEM = object()
+_DELETE_ITEM = object()
+_CHANGE_CATEGORY = object()
+_CUSTOM_TRANSLATION = object()
+_SKIP = object()
+_KEEP_EXISTING = object()
+_MOVE_TO_NEW = object()
+_KEEP_BOTH = object()
+_EDIT_MANUALLY = object()
+
+
 class CommandLineInterface(UserInterface):
     """Command-line interface implementation"""
     
     def __init__(self, translator: TranslationEngine, entity_manager: DatabaseManager, logger: Logger):
         super().__init__(translator, entity_manager, logger)
         self.import_optional_modules()
+
+        # EPUB book info location (see _edit_book_info)
+        self.book_info_dir = os.path.join(entity_manager.config.script_dir, "output")
+        self.book_info_path = os.path.join(self.book_info_dir, "book_info.json")
     
     def import_optional_modules(self):
         """Import modules needed for CLI that might not be available in all UI versions"""
@@ -1334,8 +1369,8 @@ class CommandLineInterface(UserInterface):
 
     def _delete_chapter(self, book_id, chapter_number):
         """Delete a specific chapter"""
-        # Get chapter info first
-        chapter = self.entity_manager.get_chapter(book_id=book_id, chapter_number=chapter_number)
+        # Get chapter info first (the content itself isn't needed here)
+        chapter = self.entity_manager.get_chapter_metadata(book_id=book_id, chapter_number=chapter_number)
         
         if not chapter:
             print(f"Chapter {chapter_number} not found for book ID {book_id}.")
@@ -1708,7 +1743,7 @@ class CommandLineInterface(UserInterface):
         # Create a temporary file
         fd, path = tempfile.mkstemp(suffix=".txt")
         try:
-            with os.fdopen(fd, 'w') as f:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 f.write(initial_text)
             
             # Determine which editor to use
@@ -1729,21 +1764,18 @@ class CommandLineInterface(UserInterface):
             print("Save the file and exit the editor when you're done.")
             
             # Launch the editor
-            if platform.system() == 'Windows':
-                subprocess.call([editor, path])
-            else:
-                subprocess.call([editor, path])
+            subprocess.call([editor, path])
             
-            # Read the edited content
-            with open(path, 'r') as f:
+            # Read the edited content back by path: many editors save by
+            # writing a new file and renaming it over the old one, so a
+            # handle kept open across the edit would still see the old text
+            with open(path, 'r', encoding='utf-8') as f:
                 return f.read()
                 
         finally:
             # Clean up the temporary file
-            try:
+            with contextlib.suppress(OSError):
                 os.unlink(path)
-            except:
-                pass
 
     def file_to_array(self, filename):
         """Convert a file to an array of lines"""
@@ -1758,7 +1790,7 @@ class CommandLineInterface(UserInterface):
         if self.has_rich_ui:
             self.print_json(data=data)
         else:
-            print(json.dumps(data, indent=4, ensure_ascii=False))
+            print(_json_dumps(data))
     
     def review_entities(self, data, untranslated_text=[]):
         """
@@ -1800,9 +1832,13 @@ class CommandLineInterface(UserInterface):
             print("Rich UI components not available. Skipping entity review.")
             return {}
 
+        q = self.questionary
+        confirm, select, text = q.confirm, q.select, q.text
+        em = self.entity_manager
+
         # Use book-specific categories if available, otherwise derive from data keys
         if getattr(self, 'book_id', None):
-            categories = self.entity_manager.get_book_categories(self.book_id)
+            categories = em.get_book_categories(self.book_id)
         else:
             from database import DEFAULT_CATEGORIES
             categories = list(DEFAULT_CATEGORIES)
@@ -1813,11 +1849,17 @@ class CommandLineInterface(UserInterface):
         edited_data = {cat: {} for cat in categories}
         
         while True:
+            # Nothing left to review (e.g. every item was deleted or moved away)
+            non_empty_categories = [category for category in data if data[category]]
+            if not non_empty_categories:
+                print("No entities to review.")
+                break
+            
             # 1. Display current data
             self.display_current_data(data)
             
             # 2. Ask if user wants to make changes (yes/no)
-            make_changes = self.questionary.confirm(
+            make_changes = confirm(
                 "Do you want to make any changes?"
             ).ask()  # returns True/False
             
@@ -1825,19 +1867,13 @@ class CommandLineInterface(UserInterface):
                 break
             
             # 3. Select a category
-            if not data:
-                print("No categories available.")
-                break
-            
-            # Filter out empty categories
-            non_empty_categories = [category for category in data if data[category]]
             # Let the user pick from a list, or choose "Exit"
-            category_choice = self.questionary.select(
+            category_choice = select(
                 "Select a category to edit:",
-                choices=non_empty_categories + ["Exit"]
+                choices=non_empty_categories + [q.Choice(title="Exit", value=_EXIT)]
             ).ask()
             
-            if category_choice == "Exit":
+            if category_choice is _EXIT:
                 break
             
             selected_category = category_choice
@@ -1854,47 +1890,52 @@ class CommandLineInterface(UserInterface):
             for key, item_data in items.items():
                 translation = item_data.get("translation", "")
                 display_title = f"{key} ({translation})" if translation else key
-                item_choices.append(self.questionary.Choice(title=display_title, value=key))
+                item_choices.append(q.Choice(title=display_title, value=key))
             
             # Add a "Back" option
-            item_choices.append("Back")
+            item_choices.append(q.Choice(title="Back", value=_BACK))
             
-            item_choice = self.questionary.select(
+            item_choice = select(
                 f"Select an item in '{selected_category}' to manage:",
                 choices=item_choices
             ).ask()
             
-            if item_choice == "Back":
+            if item_choice is _BACK:
                 continue
             
             selected_item_key = item_choice
             selected_item = items[selected_item_key]
             
             # 5. Ask what the user wants to do with this item
-            action = self.questionary.select(
+            action = select(
                 f"What do you want to do with '{selected_item_key}'?",
-                choices=["Edit item", "Delete item", "Change category", "Go back"]
+                choices=[
+                    q.Choice(title="Edit item", value=_EDIT_ITEM),
+                    q.Choice(title="Delete item", value=_DELETE_ITEM),
+                    q.Choice(title="Change category", value=_CHANGE_CATEGORY),
+                    q.Choice(title="Go back", value=_BACK),
+                ]
             ).ask()
             
-            if action == "Go back":
+            if action is _BACK:
                 continue
             
-            if action == "Delete item":
+            if action is _DELETE_ITEM:
                 del data[selected_category][selected_item_key]
                 print(f"Item '{selected_item_key}' deleted.")
                 edited_data[selected_category][selected_item_key] = {"deleted": True}
                 
                 # Also delete from SQLite database
-                self.entity_manager.delete_entity(selected_category, selected_item_key)
+                em.delete_entity(selected_category, selected_item_key)
                 continue
             
-            if action == "Change category":
+            if action is _CHANGE_CATEGORY:
                 # Prompt for the new category, excluding empty categories and the current category
                 non_empty_categories = [
                     cat for cat in categories
                     if cat != selected_category
                 ]
-                new_category = self.questionary.select(
+                new_category = select(
                     "Select the new category to move this item:",
                     choices=non_empty_categories
                 ).ask()
@@ -1915,73 +1956,76 @@ class CommandLineInterface(UserInterface):
                 edited_data[new_category][selected_item_key] = selected_item
                 
                 # Update category in SQLite database
-                self.entity_manager.change_entity_category(selected_category, selected_item_key, new_category)
+                em.change_entity_category(selected_category, selected_item_key, new_category)
                 
                 print(f"Moved '{selected_item_key}' from '{selected_category}' to '{new_category}'.")
                 continue
             
             # If user chose "Edit item"
             print(f"\nEditing item: {selected_item_key}")
-            was_item_edited = False
+            # Collect edits here and apply them once after all fields are visited
+            pending = {}
             
             # For each field in the item
             for field, value in list(selected_item.items()):
                 if field == "translation":
                     # Ask if user wants LLM translation
-                    wants_llm = self.questionary.confirm(
+                    wants_llm = confirm(
                         f"Do you want to ask the LLM for translation options for '{selected_item_key}'?"
                     ).ask()
                     
                     if wants_llm:
-                        node = selected_item.copy()
-                        node['category'] = selected_category
-                        node['untranslated'] = selected_item_key
+                        # get_translation_options adds keys (context, existing_translations),
+                        # so hand it a fresh dict rather than selected_item itself
+                        node = {**selected_item, 'category': selected_category, 'untranslated': selected_item_key}
                         advice = self.translator.get_translation_options(node, untranslated_text)
                         
                         print("\nLLM says:")
                         print(f"  \"{advice['message']}\"\n")
                         
                         # Add an extra "Custom" option
-                        translation_options = advice['options'] + ["Custom Translation [Your Input]", "Skip"]
+                        translation_options = advice['options'] + [
+                            q.Choice(title="Custom Translation [Your Input]", value=_CUSTOM_TRANSLATION),
+                            q.Choice(title="Skip", value=_SKIP),
+                        ]
                         
                         # Display translations as a list
-                        chosen_translation = self.questionary.select(
+                        chosen_translation = select(
                             "Choose a translation option:",
                             choices=translation_options
                         ).ask()
                         
-                        if chosen_translation == "Skip":
+                        if chosen_translation is _SKIP:
                             pass
-                        elif chosen_translation == "Custom Translation [Your Input]":
+                        elif chosen_translation is _CUSTOM_TRANSLATION:
                             # user types a custom translation
-                            custom_val = self.questionary.text(
+                            custom_val = text(
                                 "Enter your custom translation (press Enter to cancel):"
                             ).ask()
                             if custom_val:
                                 # Check if this translation already exists
-                                existing = self.entity_manager.get_entity_by_translation(custom_val)
+                                existing = em.get_entity_by_translation(custom_val)
                                 if existing and existing[1] != selected_item_key:
                                     # Show a warning
                                     existing_category, existing_key, _ = existing
                                     print(f"Warning: This translation is already used for '{existing_key}' in '{existing_category}'")
-                                    proceed = self.questionary.confirm(
+                                    proceed = confirm(
                                         "Do you want to proceed with this translation anyway?"
                                     ).ask()
                                     
                                     if not proceed:
                                         continue
                                 
-                                selected_item[field] = custom_val
-                                selected_item["incorrect_translation"] = value
-                                was_item_edited = True
+                                pending[field] = custom_val
+                                pending["incorrect_translation"] = value
                         else:
                             # Check if this translation already exists
-                            existing = self.entity_manager.get_entity_by_translation(chosen_translation)
+                            existing = em.get_entity_by_translation(chosen_translation)
                             if existing and existing[1] != selected_item_key:
                                 # Show a warning
                                 existing_category, existing_key, _ = existing
                                 print(f"Warning: This translation is already used for '{existing_key}' in '{existing_category}'")
-                                proceed = self.questionary.confirm(
+                                proceed = confirm(
                                     "Do you want to proceed with this translation anyway?"
                                 ).ask()
                                 
@@ -1989,24 +2033,23 @@ class CommandLineInterface(UserInterface):
                                     continue
                             
                             # user picked one of the suggested translations
-                            selected_item["incorrect_translation"] = value
-                            selected_item[field] = chosen_translation
-                            was_item_edited = True
+                            pending["incorrect_translation"] = value
+                            pending[field] = chosen_translation
                     
                     else:
                         # Simply prompt for updating the value
-                        new_val = self.questionary.text(
+                        new_val = text(
                             f"{field} (current: {value}). Press Enter to keep, or type new value:",
                             default=""
                         ).ask()
                         if new_val:
                             # Check if this translation already exists
-                            existing = self.entity_manager.get_entity_by_translation(new_val)
+                            existing = em.get_entity_by_translation(new_val)
                             if existing and existing[1] != selected_item_key:
                                 # Show a warning
                                 existing_category, existing_key, _ = existing
                                 print(f"Warning: This translation is already used for '{existing_key}' in '{existing_category}'")
-                                proceed = self.questionary.confirm(
+                                proceed = confirm(
                                     "Do you want to proceed with this translation anyway?"
                                 ).ask()
                                 
@@ -2015,13 +2058,12 @@ class CommandLineInterface(UserInterface):
                             
                             self.logger.debug(f"selected_item_key = {selected_item_key}")
                             self.logger.debug(f"selected_item = {selected_item}")
-                            selected_item[field] = new_val
-                            selected_item["incorrect_translation"] = value
-                            was_item_edited = True
+                            pending[field] = new_val
+                            pending["incorrect_translation"] = value
                 
                 else:
                     # For non-translation fields
-                    new_val = self.questionary.text(
+                    new_val = text(
                         f"{field} (current: {value}). Press Enter to keep, or type new value:",
                         default=""
                     ).ask()
@@ -2030,16 +2072,16 @@ class CommandLineInterface(UserInterface):
                         # If it's an int field, try to convert
                         if isinstance(value, int):
                             try:
-                                selected_item[field] = int(new_val)
+                                pending[field] = int(new_val)
                             except ValueError:
                                 print(f"Invalid input for {field}. Keeping original value.")
                                 continue
                         else:
-                            selected_item[field] = new_val
-                        was_item_edited = True
+                            pending[field] = new_val
             
             # Save item changes if it was edited
-            if was_item_edited:
+            if pending:
+                selected_item.update(pending)
                 self.logger.debug(f"selected_item_key = {selected_item_key}")
                 self.logger.debug(f"selected_item = {selected_item}")
                 self.logger.debug("Final data: %s", data)
@@ -2047,21 +2089,11 @@ class CommandLineInterface(UserInterface):
                 edited_data.setdefault(selected_category, {})
                 edited_data[selected_category][selected_item_key] = selected_item
                 
-                # Update entity in SQLite database
-                translation = selected_item.get("translation", "")
-                last_chapter = selected_item.get("last_chapter", "")
-                incorrect_translation = selected_item.get("incorrect_translation", None)
-                gender = selected_item.get("gender", None)
-                book_id = selected_item.get("book_id", None)
-
-                self.entity_manager.update_entity(
+                # Update only the edited fields in SQLite (book_id selects the row to update)
+                em.update_entity(
                     selected_category,
                     selected_item_key,
-                    translation=translation,
-                    last_chapter=last_chapter,
-                    incorrect_translation=incorrect_translation,
-                    gender=gender,
-                    book_id=book_id
+                    **{**pending, "book_id": selected_item.get("book_id")}
                 )
         
         return edited_data
@@ -2884,9 +2916,12 @@ class CommandLineInterface(UserInterface):
         added_count = 0
         skipped_count = 0
 
+        # One query for everything already queued instead of one per chapter
+        queued = self.entity_manager.get_queued_chapters()
+
         for ch in chapters:
-            # Check for duplicate using database method
-            if self.entity_manager.check_duplicate_in_queue(ch['book_id'], ch['chapter_number']):
+            # Check for duplicate against the queued set
+            if (ch['book_id'], ch['chapter_number']) in queued:
                 self.logger.info(f"Skipping duplicate: {ch['book_title']}, Ch.{ch['chapter_number']}")
                 skipped_count += 1
                 continue
@@ -2909,6 +2944,7 @@ class CommandLineInterface(UserInterface):
 
                 if queue_item_id:
                     added_count += 1
+                    queued.add((ch['book_id'], ch['chapter_number']))
                     print(f"  ✓ Queued: {ch['book_title']}, Ch.{ch['chapter_number']}")
                 else:
                     print(f"  ✗ Error: Failed to queue {ch['book_title']}, Ch.{ch['chapter_number']}")
@@ -3003,19 +3039,15 @@ class CommandLineInterface(UserInterface):
         )
         
         # Calculate statistics
-        translated_total_words = 0
-        translated_total_chars = 0
         content = end_object.get('content', [])
-        
-        for line in content:
-            translated_total_words += len(line.split())
-            translated_total_chars += len(line)
+        translated_total_words = sum(len(line.split()) for line in content)
+        translated_total_chars = sum(map(len, content))
 
         # Display summary
         self.logger.info(f"TITLE: {chapter_title}")
         self.logger.info(
             "Translated. Input text is "
-            + str(sum(len(line) for line in end_object.get('untranslated', [])))
+            + str(sum(map(len, end_object.get('untranslated', []))))
             + " characters compared to "
             + str(translated_total_words)
             + " translated words ("
@@ -3039,8 +3071,15 @@ class CommandLineInterface(UserInterface):
         """
         if not self.has_rich_ui or not duplicates:
             return []
+
+        q = self.questionary
+        select, text = q.select, q.text
+        em = self.entity_manager
         
         resolved = []
+        # "Keep in both" rows are written in one transaction after the loop;
+        # their decision is only recorded once their insert has gone through
+        pending_duplicates = []
         
         print("\n=== Entity Category Conflict Resolution ===")
         print(f"Found {len(duplicates)} potential duplicate entities across categories that need resolution.")
@@ -3066,25 +3105,25 @@ class CommandLineInterface(UserInterface):
                 print(f"Context: \"...{context}...\"")
             
             # Ask user what to do
-            action = self.questionary.select(
+            action = select(
                 "How would you like to handle this entity?",
                 choices=[
-                    "Keep in existing category (reject new suggestion)",
-                    "Move to new category (replace existing)",
-                    "Keep in both categories (allow duplication)",
-                    "Edit manually"
+                    q.Choice(title="Keep in existing category (reject new suggestion)", value=_KEEP_EXISTING),
+                    q.Choice(title="Move to new category (replace existing)", value=_MOVE_TO_NEW),
+                    q.Choice(title="Keep in both categories (allow duplication)", value=_KEEP_BOTH),
+                    q.Choice(title="Edit manually", value=_EDIT_MANUALLY),
                 ]
             ).ask()
             
-            if action == "Keep in existing category (reject new suggestion)":
+            if action is _KEEP_EXISTING:
                 # Do nothing, just record the decision
                 duplicate['decision'] = 'keep_existing'
                 resolved.append(duplicate)
                 print(f"Decision: Keeping '{untranslated}' in '{existing_category}'")
             
-            elif action == "Move to new category (replace existing)":
+            elif action is _MOVE_TO_NEW:
                 # Move the entity to the new category
-                result = self.entity_manager.change_entity_category(existing_category, untranslated, new_category)
+                result = em.change_entity_category(existing_category, untranslated, new_category)
                 
                 if result:
                     duplicate['decision'] = 'move_to_new'
@@ -3093,42 +3132,23 @@ class CommandLineInterface(UserInterface):
                 else:
                     print(f"Failed to move entity. See logs for details.")
             
-            elif action == "Keep in both categories (allow duplication)":
+            elif action is _KEEP_BOTH:
                 # Allow the duplication - need to add it manually as database constraints prevent this
-                duplicate['decision'] = 'allow_duplicate'
                 resolved.append(duplicate)
-                print(f"Decision: Allowing '{untranslated}' in both '{existing_category}' and '{new_category}'")
-                
-                # Need to override database constraints to add this duplicate
-                try:
-                    conn = self.entity_manager.get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute('''
-                    INSERT INTO entities (category, untranslated, translation, last_chapter)
-                    VALUES (?, ?, ?, ?)
-                    ''', (new_category, untranslated, translation, duplicate.get('last_chapter', 'THIS CHAPTER')))
-                    conn.commit()
-                    conn.close()
-
-                    # Update memory cache
-                    self.entity_manager._load_entities()
-
-                except Exception as e:
-                    self.logger.error(f"Error allowing duplicate: {e}")
-                    print(f"Database error: {e}")
-            
-            elif action == "Edit manually":
+                pending_duplicates.append(duplicate)
+            
+            elif action is _EDIT_MANUALLY:
                 # Allow detailed editing
                 print("\nManual Editing:")
 
                 # Choose category
-                target_category = self.questionary.select(
+                target_category = select(
                     "Which category should this entity be in?",
                     choices=self._get_categories_for_context()
                 ).ask()
                 
                 # Choose translation
-                custom_translation = self.questionary.text(
+                custom_translation = text(
                     f"Enter translation for '{untranslated}' (default: '{translation}'):",
                     default=translation
                 ).ask()
@@ -3136,7 +3156,7 @@ class CommandLineInterface(UserInterface):
                 # Apply changes
                 if existing_category == target_category:
                     # Update existing entity
-                    self.entity_manager.update_entity(
+                    em.update_entity(
                         target_category, 
                         untranslated, 
                         translation=custom_translation
@@ -3144,7 +3164,7 @@ class CommandLineInterface(UserInterface):
                     print(f"Updated '{untranslated}' in '{target_category}' with translation '{custom_translation}'")
                 else:
                     # Move to new category (preserves origin_chapter and other metadata)
-                    self.entity_manager.update_entity(
+                    em.update_entity(
                         existing_category,
                         untranslated,
                         category=target_category,
@@ -3157,6 +3177,48 @@ class CommandLineInterface(UserInterface):
                 duplicate['final_translation'] = custom_translation
                 resolved.append(duplicate)
         
+        if pending_duplicates:
+            # Need to override database constraints to add these duplicates.
+            # One transaction, but each row on its own so a failure is
+            # reported against its entity and doesn't undo the others
+            allowed = []
+            try:
+                conn = em.get_connection()
+                cursor = conn.cursor()
+                for duplicate in pending_duplicates:
+                    untranslated = duplicate['untranslated']
+                    try:
+                        cursor.execute('''
+                        INSERT INTO entities (category, untranslated, translation, last_chapter)
+                        VALUES (?, ?, ?, ?)
+                        ''', (duplicate['new_category'], untranslated, duplicate['translation'],
+                              duplicate.get('last_chapter', 'THIS CHAPTER')))
+                        allowed.append(duplicate)
+                    except Exception as e:
+                        duplicate['decision'] = 'allow_duplicate_failed'
+                        duplicate['error'] = str(e)
+                        self.logger.error(f"Error allowing duplicate '{untranslated}': {e}")
+                        print(f"Database error allowing '{untranslated}': {e}")
+                conn.commit()
+                conn.close()
+
+                # Update memory cache once for the whole batch
+                em._load_entities()
+
+            except Exception as e:
+                self.logger.error(f"Error allowing duplicates: {e}")
+                print(f"Database error: {e}")
+                # Nothing was committed: every pending row failed
+                for duplicate in pending_duplicates:
+                    duplicate['decision'] = 'allow_duplicate_failed'
+                    duplicate.setdefault('error', str(e))
+                allowed = []
+
+            for duplicate in allowed:
+                duplicate['decision'] = 'allow_duplicate'
+                print(f"Decision: Allowing '{duplicate['untranslated']}' in both "
+                      f"'{duplicate['existing_category']}' and '{duplicate['new_category']}'")
+        
         print("\nAll duplicate entities have been resolved.")
         return resolved
     
@@ -3218,15 +3280,12 @@ class CommandLineInterface(UserInterface):
                 book_info["description"] = description
         
         # Save the updated book info
-        output_dir = os.path.join(self.entity_manager.config.script_dir, "output")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        book_info_path = os.path.join(output_dir, "book_info.json")
+        os.makedirs(self.book_info_dir, exist_ok=True)
+        book_info_path = self.book_info_path
         
         try:
             with open(book_info_path, 'w', encoding='utf-8') as f:
-                json.dump(book_info, f, indent=4, ensure_ascii=False)
+                f.write(_json_dumps(book_info))
             print(f"Book information saved to {book_info_path}")
         except Exception as e:
             self.logger.error(f"Error saving book info: {e}")
@@ -1,44 +1,123 @@
 from dotenv import load_dotenv
+import functools
 import json
 import os
-from providers import create_provider, get_factory
+import sys
+
+# Directory containing this module (the project root), with a trailing separator
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once():
+    """Load the .env file into os.environ; only the first call touches disk."""
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_model_spec(model_spec):
+    """
+    Parse a model specification string (results are memoized).
+    
+    Args:
+        model_spec: String in format "provider:model" or just "model"
+    
+    Returns:
+        tuple: (provider, model_name)
+    """
+    provider, sep, model_name = model_spec.partition(":")
+    if not sep:
+        # Default to OpenAI if no provider specified
+        provider, model_name = "oai", model_spec
+        
+    # Interned so every spec for the same provider shares one key string
+    # (cheap identity hits in the provider cache)
+    return sys.intern(provider.lower()), model_name
+
 
 class TranslationConfig:
     """Configuration class for translation settings"""
     
     def __init__(self):
-        load_dotenv()
+        _load_env_once()
+        # One snapshot of the environment for all the lookups below
+        env = dict(os.environ)
         
         # API credentials
-        self.deepseek_key = os.getenv("DEEPSEEK_KEY")
-        self.openai_key = os.getenv("OPENAI_KEY")
+        self.deepseek_key = env.get("DEEPSEEK_KEY")
+        self.openai_key = env.get("OPENAI_KEY")
         
         # Model settings - now stored with provider prefix
-        self.translation_model = os.getenv("TRANSLATION_MODEL", "oai:o3-mini")
-        self.advice_model = os.getenv("ADVICE_MODEL", "oai:o3-mini")
+        # (the property setters also keep the parsed (provider, model) pair)
+        self.translation_model = env.get("TRANSLATION_MODEL", "oai:o3-mini")
+        self.advice_model = env.get("ADVICE_MODEL", "oai:o3-mini")
         
         # Debug mode
-        self.debug_mode = os.getenv("DEBUG") == "True"
+        self.debug_mode = env.get("DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
         
         # Paths
-        self.script_dir = os.path.dirname(os.path.abspath(__file__)) + "/"
+        self.script_dir = _SCRIPT_DIR
         
         # WordPress / Fictioneer publishing
-        self.wp_url = os.getenv("WP_URL", "")
-        self.wp_username = os.getenv("WP_USERNAME", "")
-        self.wp_app_password = os.getenv("WP_APP_PASSWORD", "")
+        self.wp_url = env.get("WP_URL", "")
+        self.wp_username = env.get("WP_USERNAME", "")
+        self.wp_app_password = env.get("WP_APP_PASSWORD", "")
 
         # Database backend: "sqlite" (default) or "mysql"
-        self.db_backend = os.getenv("DB_BACKEND", "sqlite")
-        self.mysql_host = os.getenv("MYSQL_HOST", "localhost")
-        self.mysql_user = os.getenv("MYSQL_USER", "")
-        self.mysql_pass = os.getenv("MYSQL_PASS", "")
-        self.mysql_db = os.getenv("MYSQL_DB", "t9")
-        self.mysql_port = int(os.getenv("MYSQL_PORT", "3306"))
+        self.db_backend = env.get("DB_BACKEND", "sqlite")
+        self.mysql_host = env.get("MYSQL_HOST", "localhost")
+        self.mysql_user = env.get("MYSQL_USER", "")
+        self.mysql_pass = env.get("MYSQL_PASS", "")
+        self.mysql_db = env.get("MYSQL_DB", "t9")
+        self.mysql_port = int(env.get("MYSQL_PORT", "3306"))
 
         # Translation settings (now per-provider via models.json)
         # Legacy fallback for MAX_CHARS env var if needed
-        self._fallback_max_chars = int(os.getenv("MAX_CHARS", "5000"))
+        self._fallback_max_chars = int(env.get("MAX_CHARS", "5000"))
+
+        # Provider instances keyed by provider name, reused across calls
+        self._provider_cache = {}
+        # Chunk size limits keyed by model spec
+        self._max_chars_cache = {}
+
+    @property
+    def translation_model(self):
+        return self._translation_model
+
+    @translation_model.setter
+    def translation_model(self, model_spec):
+        self._translation_model = model_spec
+        self._translation_spec = _parse_model_spec(model_spec)
+
+    @property
+    def advice_model(self):
+        return self._advice_model
+
+    @advice_model.setter
+    def advice_model(self, model_spec):
+        self._advice_model = model_spec
+        self._advice_spec = _parse_model_spec(model_spec)
+
+    def _resolve_model_spec(self, model_spec):
+        """Return (provider, model_name) for a spec; the configured models are pre-parsed."""
+        if model_spec is None or model_spec == self._translation_model:
+            return self._translation_spec
+        if model_spec == self._advice_model:
+            return self._advice_spec
+        return _parse_model_spec(model_spec)
+
+    def _get_provider_cached(self, provider, model_name):
+        """Return the cached provider instance, creating it on first use."""
+        provider_instance = self._provider_cache.get(provider)
+        if provider_instance is None:
+            from providers import create_provider
+            try:
+                provider_instance = create_provider(provider)
+            except (ValueError, RuntimeError) as e:
+                # Fallback error message with more context
+                raise ValueError(f"Failed to create provider '{provider}' for model '{model_name}': {e}")
+            self._provider_cache[provider] = provider_instance
+        return provider_instance
 
     def get_client(self, model_spec=None):
         """
@@ -51,19 +130,13 @@ class TranslationConfig:
         Returns:
             tuple: (provider, model_name)
         """
-        if model_spec is None:
-            model_spec = self.translation_model
-        
-        # Parse provider and model
-        provider, model_name = self.parse_model_spec(model_spec)
-        
-        # Create provider using factory
-        try:
-            provider_instance = create_provider(provider)
-            return provider_instance, model_name
-        except (ValueError, RuntimeError) as e:
-            # Fallback error message with more context
-            raise ValueError(f"Failed to create provider '{provider}' for model '{model_name}': {e}")
+        provider, model_name = self._resolve_model_spec(model_spec)
+        return self._get_provider_cached(provider, model_name), model_name
+
+    def clear_provider_cache(self):
+        """Drop cached provider instances (e.g. after an API key changes)."""
+        self._provider_cache.clear()
+        self._max_chars_cache.clear()
         
     def get_provider(self, model_spec=None):
         """
@@ -75,34 +148,19 @@ class TranslationConfig:
         Returns:
             ModelProvider instance
         """
-        provider, _ = self.get_client(model_spec)
-        return provider
+        return self._get_provider_cached(*self._resolve_model_spec(model_spec))
     
-    def parse_model_spec(self, model_spec):
-        """
-        Parse a model specification string.
-        
-        Args:
-            model_spec: String in format "provider:model" or just "model"
-        
-        Returns:
-            tuple: (provider, model_name)
-        """
-        if ":" in model_spec:
-            provider, model_name = model_spec.split(":", 1)
-        else:
-            # Default to OpenAI if no provider specified
-            provider = "oai"
-            model_name = model_spec
-            
-        return provider.lower(), model_name
+    # Kept as a (static) method for existing callers
+    parse_model_spec = staticmethod(_parse_model_spec)
     
     def get_supported_providers(self):
         """Get list of supported providers."""
+        from providers import get_factory
         return get_factory().get_supported_providers()
     
     def get_default_model(self, provider_name):
         """Get default model for a provider."""
+        from providers import get_factory
         return get_factory().get_default_model(provider_name)
     
     def get_max_chars(self, model_spec=None):
@@ -116,10 +174,27 @@ class TranslationConfig:
         Returns:
             Maximum characters per chunk for the provider
         """
+        if model_spec is None:
+            model_spec = self._translation_model
+        max_chars = self._max_chars_cache.get(model_spec)
+        if max_chars is not None:
+            return max_chars
         try:
             provider = self.get_provider(model_spec)
-            return provider.max_chars
         except (ValueError, RuntimeError):
-            # Fallback to legacy MAX_CHARS environment variable
+            # Fallback to legacy MAX_CHARS environment variable (not cached,
+            # so the real limit is used once the provider becomes available)
             return self._fallback_max_chars
+        max_chars = self._max_chars_cache[model_spec] = provider.max_chars
+        return max_chars
+
+
+_INSTANCE = None
+
 
+def get_config():
+    """Return the process-wide TranslationConfig, creating it on first use."""
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = TranslationConfig()
+    return _INSTANCE
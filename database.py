@@ -5,16 +5,146 @@ import os
 import datetime
 from typing import Dict, List, Optional, Any, Union, Tuple
 from itertools import zip_longest
+import functools
 import re
+import threading
+import time
+from collections import OrderedDict
 from db_backend import create_backend
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Set once the legacy queue.json check has run in this process
+_legacy_queue_checked = False
+
+# Bump whenever _migrate_schema gains a new table, index or column migration,
+# so existing SQLite databases run it again on next start
+SCHEMA_VERSION = 3
+
 DEFAULT_CATEGORIES = [
     'characters', 'places', 'organizations', 'abilities',
     'titles', 'equipment', 'creatures'
 ]
 
+
+def _json_dumps(data):
+    """Serialize chapter/queue data for a TEXT column, keeping non-ASCII text as-is."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _json_loads(raw):
+    """Parse stored JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json_column(raw, default):
+    """
+    Parse a JSON TEXT column, returning default for empty or non-JSON values.
+
+    Only values that start like a JSON array, object or string are parsed, so
+    plain-text rows skip the failed parse (and its exception) entirely.
+    """
+    if raw and raw[0] in '[{"':
+        try:
+            return _json_loads(raw)
+        except json.JSONDecodeError:
+            pass
+    return default
+
+
+def _as_text(value):
+    """Coerce a JSON scalar to the str a TEXT column reads back (None stays None)."""
+    return None if value is None else str(value)
+
+
+def _decode_lines(raw):
+    """
+    Decode stored chapter content into a list of lines.
+
+    Content is normally a JSON list; older rows may hold plain newline-separated
+    text, which is split directly instead of going through a failed JSON parse.
+    """
+    if not raw:
+        return []
+    if raw[0] == '[':
+        try:
+            return _json_loads(raw)
+        except json.JSONDecodeError:
+            pass
+    return raw.split('\n')
+
+
+# Columns update_book() may write
+_ALLOWED_BOOK_FIELDS = frozenset({
+    'title', 'author', 'language', 'description', 'source_language',
+    'target_language', 'modified_date', 'cover_image', 'is_public',
+    'total_source_chapters', 'status',
+})
+
+# Value conversions applied by update_book() before binding
+_BOOK_FIELD_CONVERTERS = {
+    'is_public': int,
+    'total_source_chapters': lambda value: int(value) if value is not None else None,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_ci(text):
+    """Compile a case-insensitive literal pattern for text (memoized)."""
+    return re.compile(re.escape(text), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_short(text):
+    """NFC-normalize a short string such as an entity key (memoized)."""
+    return unicodedata.normalize('NFC', text)
+
+
+def _case_style(word):
+    """Classify a word's casing: 0 UPPER, 1 Title, 2 lower, 3 anything else (kept as is)."""
+    if word.isupper():
+        return 0
+    if word.istitle():
+        return 1
+    if word.islower():
+        return 2
+    return 3
+
+
+def _copy_book(book_info):
+    """Copy a cached book dict so callers can't mutate the cache entry."""
+    book_info = dict(book_info)
+    if book_info["categories"] is not None:
+        book_info["categories"] = list(book_info["categories"])
+    return book_info
+
+
 class DatabaseManager:
     """Class to manage database operations including entities, books, and chapters using SQLite"""
+
+    # get_book(book_id=...) cache. Writes made through this manager invalidate
+    # entries immediately; the TTL only bounds how long a change made by
+    # another process (e.g. the web server) can go unnoticed.
+    BOOK_CACHE_TTL = 60
+    BOOK_CACHE_SIZE = 128
+
+    # get_queue_count/check_duplicate_in_queue results, dropped on every queue
+    # write made here; kept short since another process may be working the queue
+    QUEUE_CACHE_TTL = 5
     
     def __init__(self, config: 'TranslationConfig', logger: 'Logger'):
         self.config = config
@@ -22,13 +152,27 @@ class DatabaseManager:
         self.backend = create_backend(config)
         self.db_path = self.backend.db_path  # backward compat for external callers
         self.entities = {}  # Cached entities
+        self._book_cache = OrderedDict()  # book_id -> (fetched_at, book dict)
+        # The web app shares one manager between the event loop and the
+        # translation thread, so the LRUs' multi-step updates are locked
+        self._book_cache_lock = threading.Lock()
+        self._known_book_ids = set()  # book IDs seen to exist
+        self._entity_matcher_cache = OrderedDict()  # id(entity dict) -> (keys, matcher)
+        self._entity_matcher_lock = threading.Lock()
+        self._queue_count_cache = {}  # book_id or None -> (fetched_at, count)
+        self._queue_dup_cache = {}  # (book_id, chapter_number) -> (fetched_at, bool)
+        self._chapter_fts = False  # chapters_fts full-text index available (SQLite)
         self._initialize_database()
         self._load_entities()
         self._check_legacy_queue()
 
     def get_connection(self):
-        """Return a new database connection via the configured backend."""
+        """Return a database connection via the configured backend (pooled per thread for SQLite)."""
         return self.backend.get_connection()
+
+    def close(self):
+        """Close any pooled database connections."""
+        self.backend.close_all()
     
     def _initialize_database(self):
         """Initialize the database with proper schema if it doesn't exist"""
@@ -36,19 +180,17 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
-            # Create all tables using backend-specific DDL
-            for ddl in self.backend.create_tables_ddl():
-                try:
-                    cursor.execute(ddl)
-                except Exception:
-                    # Index may already exist (MySQL raises on IF NOT EXISTS for some index forms)
-                    pass
-
-            # Migrations: add columns if missing
-            entity_cols = self.backend.get_table_columns(conn, 'entities')
-            if 'origin_chapter' not in entity_cols:
-                cursor.execute("ALTER TABLE entities ADD COLUMN origin_chapter INTEGER")
-                self.logger.info("Added origin_chapter column to entities table")
+            # SQLite databases record the schema version they were last
+            # migrated to, so a current one skips the DDL and column checks
+            schema_current = False
+            if self.backend.name == 'sqlite':
+                cursor.execute("PRAGMA user_version")
+                schema_current = cursor.fetchone()[0] >= SCHEMA_VERSION
+            if not schema_current:
+                self._migrate_schema(conn, cursor)
+            if self.backend.name == 'sqlite':
+                self._chapter_fts = self._ensure_chapter_fts(cursor)
+
             # Backfill: set origin_chapter = last_chapter for entities missing it
             # Only copy values that are actually numeric (SQLite allows text in INTEGER columns, MySQL doesn't)
             if self.backend.name == 'mysql':
@@ -57,61 +199,8 @@ class DatabaseManager:
                 cursor.execute("UPDATE entities SET origin_chapter = last_chapter WHERE origin_chapter IS NULL AND last_chapter IS NOT NULL")
             if cursor.rowcount > 0:
                 self.logger.info(f"Backfilled origin_chapter for {cursor.rowcount} entities")
-            if 'note' not in entity_cols:
-                cursor.execute("ALTER TABLE entities ADD COLUMN note TEXT")
-                self.logger.info("Added note column to entities table")
-
-            chapter_cols = self.backend.get_table_columns(conn, 'chapters')
-            if 'is_proofread' not in chapter_cols:
-                if self.backend.name == 'mysql':
-                    cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread DATETIME NULL")
-                else:
-                    cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread TEXT")
-                self.logger.info("Added is_proofread column to chapters table")
-            else:
-                # Migrate from INTEGER (0/1) to timestamp if needed
-                if self.backend.name == 'mysql':
-                    # Check if column is still INT and needs conversion to DATETIME
-                    cursor.execute("SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'chapters' AND COLUMN_NAME = 'is_proofread'")
-                    row = cursor.fetchone()
-                    if row and row[0] == 'int':
-                        now = datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-                        # Add a temp DATETIME column, copy data, swap
-                        cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread_new DATETIME NULL")
-                        cursor.execute("UPDATE chapters SET is_proofread_new = ? WHERE is_proofread = 1", (now,))
-                        cursor.execute("ALTER TABLE chapters DROP COLUMN is_proofread")
-                        cursor.execute("ALTER TABLE chapters CHANGE COLUMN is_proofread_new is_proofread DATETIME NULL")
-                        self.logger.info("Migrated is_proofread from INT to DATETIME (MySQL)")
-                else:
-                    cursor.execute("SELECT COUNT(*) FROM chapters WHERE is_proofread = '1' OR is_proofread = '0'")
-                    count = cursor.fetchone()[0]
-                    if count > 0:
-                        now = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
-                        cursor.execute("UPDATE chapters SET is_proofread = ? WHERE is_proofread = '1'", (now,))
-                        cursor.execute("UPDATE chapters SET is_proofread = NULL WHERE is_proofread = '0'")
-                        self.logger.info("Migrated is_proofread from boolean to timestamp")
-
-            book_cols = self.backend.get_table_columns(conn, 'books')
-            if 'cover_image' not in book_cols:
-                cursor.execute("ALTER TABLE books ADD COLUMN cover_image TEXT")
-                self.logger.info("Added cover_image column to books table")
-            if 'categories' not in book_cols:
-                cursor.execute("ALTER TABLE books ADD COLUMN categories TEXT")
-                self.logger.info("Added categories column to books table")
-            if 'is_public' not in book_cols:
-                cursor.execute("ALTER TABLE books ADD COLUMN is_public INTEGER DEFAULT 1")
-                self.logger.info("Added is_public column to books table")
-            if 'total_source_chapters' not in book_cols:
-                cursor.execute("ALTER TABLE books ADD COLUMN total_source_chapters INTEGER")
-                self.logger.info("Added total_source_chapters column to books table")
-            if 'status' not in book_cols:
-                cursor.execute("ALTER TABLE books ADD COLUMN status TEXT DEFAULT 'ongoing'")
-                self.logger.info("Added status column to books table")
-
-            queue_cols = self.backend.get_table_columns(conn, 'queue')
-            if 'retranslation_reason' not in queue_cols:
-                cursor.execute("ALTER TABLE queue ADD COLUMN retranslation_reason TEXT")
-                self.logger.info("Added retranslation_reason column to queue table")
+            if self.backend.name == 'sqlite' and not schema_current:
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
             # Create covers directory (only meaningful for local installs)
             if self.backend.name == 'sqlite':
@@ -127,6 +216,123 @@ class DatabaseManager:
             self.logger.error(f"Database initialization error: {e}")
             raise
 
+    def _ensure_chapter_fts(self, cursor):
+        """
+        Create the chapter full-text index if it doesn't exist yet.
+
+        Returns:
+            bool: True if chapters_fts is available, False if this SQLite
+                  build lacks FTS5 or the trigram tokenizer
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chapters_fts'")
+        if cursor.fetchone():
+            return True
+
+        try:
+            for ddl in self.backend.chapter_fts_ddl():
+                cursor.execute(ddl)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Chapter full-text index unavailable, entity searches will scan chapters: {e}")
+            try:
+                cursor.execute("DROP TABLE IF EXISTS chapters_fts")
+            except sqlite3.Error:
+                pass
+            return False
+
+        self.logger.info("Built full-text index over chapter contents")
+        return True
+
+    def _migrate_schema(self, conn, cursor):
+        """Create missing tables/indexes and add columns introduced since older releases."""
+        # Create all tables using backend-specific DDL
+        ddl_statements = self.backend.create_tables_ddl()
+        if self.backend.name == 'sqlite':
+            # One script in one transaction: a single commit for the whole
+            # schema instead of one per statement
+            try:
+                conn.executescript("BEGIN;\n" + ";\n".join(ddl_statements) + ";\nCOMMIT;")
+                ddl_statements = []
+            except sqlite3.Error:
+                # e.g. the unique queue position index on an old queue with
+                # duplicate positions; redo statement by statement below so
+                # everything else still gets created
+                conn.rollback()
+        for ddl in ddl_statements:
+            try:
+                cursor.execute(ddl)
+            except Exception:
+                # Index may already exist (MySQL raises on IF NOT EXISTS for some index forms)
+                pass
+
+        # Migrations: add columns if missing
+        entity_cols = self.backend.get_table_columns(conn, 'entities')
+        if 'origin_chapter' not in entity_cols:
+            cursor.execute("ALTER TABLE entities ADD COLUMN origin_chapter INTEGER")
+            self.logger.info("Added origin_chapter column to entities table")
+        if 'note' not in entity_cols:
+            cursor.execute("ALTER TABLE entities ADD COLUMN note TEXT")
+            self.logger.info("Added note column to entities table")
+
+        chapter_cols = self.backend.get_table_columns(conn, 'chapters')
+        if 'is_proofread' not in chapter_cols:
+            if self.backend.name == 'mysql':
+                cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread DATETIME NULL")
+            else:
+                cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread TEXT")
+            self.logger.info("Added is_proofread column to chapters table")
+        else:
+            # Migrate from INTEGER (0/1) to timestamp if needed
+            if self.backend.name == 'mysql':
+                # Check if column is still INT and needs conversion to DATETIME
+                cursor.execute("SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'chapters' AND COLUMN_NAME = 'is_proofread'")
+                row = cursor.fetchone()
+                if row and row[0] == 'int':
+                    now = datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+                    # Add a temp DATETIME column, copy data, swap
+                    cursor.execute("ALTER TABLE chapters ADD COLUMN is_proofread_new DATETIME NULL")
+                    cursor.execute("UPDATE chapters SET is_proofread_new = ? WHERE is_proofread = 1", (now,))
+                    cursor.execute("ALTER TABLE chapters DROP COLUMN is_proofread")
+                    cursor.execute("ALTER TABLE chapters CHANGE COLUMN is_proofread_new is_proofread DATETIME NULL")
+                    self.logger.info("Migrated is_proofread from INT to DATETIME (MySQL)")
+            else:
+                cursor.execute("SELECT COUNT(*) FROM chapters WHERE is_proofread = '1' OR is_proofread = '0'")
+                count = cursor.fetchone()[0]
+                if count > 0:
+                    now = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+                    cursor.execute("UPDATE chapters SET is_proofread = ? WHERE is_proofread = '1'", (now,))
+                    cursor.execute("UPDATE chapters SET is_proofread = NULL WHERE is_proofread = '0'")
+                    self.logger.info("Migrated is_proofread from boolean to timestamp")
+
+        if self.backend.name == 'sqlite':
+            # Covering index for list_chapters: chapter metadata is read from
+            # the index alone, without pulling the large content rows into cache
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chapters_list ON chapters"
+                "(book_id, chapter_number, title, translation_date, translation_model, is_proofread)"
+            )
+
+        book_cols = self.backend.get_table_columns(conn, 'books')
+        if 'cover_image' not in book_cols:
+            cursor.execute("ALTER TABLE books ADD COLUMN cover_image TEXT")
+            self.logger.info("Added cover_image column to books table")
+        if 'categories' not in book_cols:
+            cursor.execute("ALTER TABLE books ADD COLUMN categories TEXT")
+            self.logger.info("Added categories column to books table")
+        if 'is_public' not in book_cols:
+            cursor.execute("ALTER TABLE books ADD COLUMN is_public INTEGER DEFAULT 1")
+            self.logger.info("Added is_public column to books table")
+        if 'total_source_chapters' not in book_cols:
+            cursor.execute("ALTER TABLE books ADD COLUMN total_source_chapters INTEGER")
+            self.logger.info("Added total_source_chapters column to books table")
+        if 'status' not in book_cols:
+            cursor.execute("ALTER TABLE books ADD COLUMN status TEXT DEFAULT 'ongoing'")
+            self.logger.info("Added status column to books table")
+
+        queue_cols = self.backend.get_table_columns(conn, 'queue')
+        if 'retranslation_reason' not in queue_cols:
+            cursor.execute("ALTER TABLE queue ADD COLUMN retranslation_reason TEXT")
+            self.logger.info("Added retranslation_reason column to queue table")
+
     # Book management section 
     def create_book(self, title, author=None, language='en', description=None, source_language='zh', target_language='en'):
         """
@@ -147,27 +353,30 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
             
-            # Check if book already exists
-            cursor.execute("SELECT id FROM books WHERE title = ?", (title,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                self.logger.info(f"Book '{title}' already exists with ID {existing[0]}")
-                conn.close()
-                return existing[0]
-            
             # Current timestamp
             timestamp = datetime.datetime.now().isoformat()
             
-            cursor.execute('''
-            INSERT INTO books
-            (title, author, language, description, created_date, modified_date, source_language, target_language)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (title, author, language, description, timestamp, timestamp, source_language, target_language))
-            
-            book_id = cursor.lastrowid
+            # Insert, or get the existing book's ID, in one statement
+            cursor.execute(self.backend.insert_or_get_book_sql(),
+                           (title, author, language, description, timestamp, timestamp,
+                            source_language, target_language))
+            if self.backend.name == 'sqlite':
+                if not self.backend.supports_returning:
+                    cursor.execute('SELECT id, created_date FROM books WHERE title = ?', (title,))
+                book_id, created_date = cursor.fetchone()
+                created = created_date == timestamp
+            else:
+                # With CLIENT_FOUND_ROWS an untouched existing row also reports 1;
+                # that only affects which message is logged below
+                book_id = cursor.lastrowid
+                created = cursor.rowcount == 1
             conn.commit()
             conn.close()
+            self._known_book_ids.add(book_id)
+            
+            if not created:
+                self.logger.info(f"Book '{title}' already exists with ID {book_id}")
+                return book_id
             
             self.logger.info(f"Created new book: '{title}' with ID {book_id}")
             return book_id
@@ -247,6 +456,7 @@ class DatabaseManager:
             cursor.execute("UPDATE books SET categories = ? WHERE id = ?", (value, book_id))
             conn.commit()
             conn.close()
+            self._invalidate_book(book_id)
             return True
         except Exception as e:
             self.logger.error(f"Error setting book categories: {e}")
@@ -266,9 +476,20 @@ class DatabaseManager:
         if not book_id and not title:
             self.logger.error("Either book_id or title must be provided")
             return None
+
+        if book_id:
+            with self._book_cache_lock:
+                cached = self._book_cache.get(book_id)
+                if cached and time.monotonic() - cached[0] < self.BOOK_CACHE_TTL:
+                    self._book_cache.move_to_end(book_id)
+                else:
+                    cached = None
+            if cached:
+                return _copy_book(cached[1])
             
         try:
             conn = self.backend.get_connection()
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
             if book_id:
@@ -294,25 +515,13 @@ class DatabaseManager:
             if not row:
                 return None
 
-            raw_cats = row[10] if len(row) > 10 else None
-            book_info = {
-                "id": row[0],
-                "title": row[1],
-                "author": row[2],
-                "language": row[3],
-                "description": row[4],
-                "created_date": row[5],
-                "modified_date": row[6],
-                "source_language": row[7],
-                "target_language": row[8],
-                "cover_image": row[9] if len(row) > 9 else None,
-                "categories": json.loads(raw_cats) if raw_cats else None,
-                "is_public": bool(row[11]) if len(row) > 11 else True,
-                "total_source_chapters": row[12] if len(row) > 12 else None,
-                "status": row[13] if len(row) > 13 else "ongoing",
-            }
-            
-            return book_info
+            book_info = dict(row)
+            raw_cats = book_info["categories"]
+            book_info["categories"] = json.loads(raw_cats) if raw_cats else None
+            book_info["is_public"] = bool(book_info["is_public"])
+
+            self._cache_book(book_info)
+            return _copy_book(book_info)
             
         except Exception as e:
             self.logger.error(f"Error getting book information: {e}")
@@ -340,42 +549,36 @@ class DatabaseManager:
                 conn.close()
                 return False
             
-            # Build the SET clause dynamically based on provided kwargs
-            set_clause = []
-            values = []
-            
             # Update modified_date automatically
             kwargs["modified_date"] = datetime.datetime.now().isoformat()
-            
-            for key, value in kwargs.items():
-                if key in ['title', 'author', 'language', 'description', 'source_language',
-                        'target_language', 'modified_date', 'cover_image', 'is_public',
-                        'total_source_chapters', 'status']:
-                    set_clause.append(f"{key} = ?")
-                    if key == 'is_public':
-                        values.append(int(value))
-                    elif key == 'total_source_chapters':
-                        values.append(int(value) if value is not None else None)
-                    else:
-                        values.append(value)
-            
-            if not set_clause:
+
+            # Build the SET clause dynamically based on provided kwargs.
+            # Sorted so the same set of fields always yields the same SQL text
+            # (and hits the connection's prepared-statement cache)
+            pairs = [(key, value) for key, value in sorted(kwargs.items())
+                     if key in _ALLOWED_BOOK_FIELDS]
+
+            if not pairs:
                 self.logger.warning("No valid fields to update")
                 conn.close()
                 return False
-            
+
+            set_sql = ', '.join(f"{key} = ?" for key, _ in pairs)
+            values = [_BOOK_FIELD_CONVERTERS[key](value) if key in _BOOK_FIELD_CONVERTERS else value
+                      for key, value in pairs]
             # Complete the parameter list with book_id
             values.append(book_id)
-            
+
             # Execute the update
             cursor.execute(f'''
-            UPDATE books 
-            SET {', '.join(set_clause)}
+            UPDATE books
+            SET {set_sql}
             WHERE id = ?
             ''', values)
             
             conn.commit()
             conn.close()
+            self._invalidate_book(book_id)
 
             # Invalidate cached EPUB if metadata that affects it changed
             epub_fields = {'title', 'author', 'language', 'description', 'cover_image'}
@@ -398,36 +601,32 @@ class DatabaseManager:
         """
         try:
             conn = self.backend.get_connection()
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
+            # Count chapters in one grouped pass instead of a subquery per book
             cursor.execute('''
-            SELECT id, title, author, language, created_date, cover_image, categories,
-                (SELECT COUNT(*) FROM chapters WHERE book_id = books.id) as chapter_count,
-                description, is_public, total_source_chapters, status
-            FROM books
-            ORDER BY title
+            SELECT b.id, b.title, b.author, b.language, b.created_date, b.cover_image, b.categories,
+                COALESCE(c.chapter_count, 0) as chapter_count,
+                b.description, b.is_public, b.total_source_chapters, b.status
+            FROM books b
+            LEFT JOIN (
+                SELECT book_id, COUNT(*) as chapter_count
+                FROM chapters
+                GROUP BY book_id
+            ) c ON c.book_id = b.id
+            ORDER BY b.title
             ''')
 
             rows = cursor.fetchall()
             conn.close()
 
-            result = []
-            for row in rows:
-                book_id, title, author, language, created_date, cover_image, raw_cats, chapter_count, description, is_public, total_source_chapters, status = row
-                result.append({
-                    "id": book_id,
-                    "title": title,
-                    "author": author,
-                    "language": language,
-                    "created_date": created_date,
-                    "cover_image": cover_image,
-                    "categories": json.loads(raw_cats) if raw_cats else None,
-                    "chapter_count": chapter_count,
-                    "description": description,
-                    "is_public": bool(is_public) if is_public is not None else True,
-                    "total_source_chapters": total_source_chapters,
-                    "status": status or "ongoing",
-                })
+            result = [dict(row) for row in rows]
+            for book in result:
+                raw_cats = book["categories"]
+                book["categories"] = json.loads(raw_cats) if raw_cats else None
+                book["is_public"] = bool(book["is_public"]) if book["is_public"] is not None else True
+                book["status"] = book["status"] or "ongoing"
             
             return result
             
@@ -471,6 +670,8 @@ class DatabaseManager:
             
             conn.commit()
             conn.close()
+            self._invalidate_book(book_id, deleted=True)
+            self._invalidate_queue_cache()  # queue rows cascade with the book
             self.invalidate_epub_cache(book_id)
 
             self.logger.info(f"Deleted book '{book_title}' (ID: {book_id}) and all its chapters")
@@ -481,7 +682,44 @@ class DatabaseManager:
             return False
         
     # Private Book methods
-
+    def _cache_book(self, book_info):
+        """Store a freshly read book in the get_book cache, evicting the least recently used."""
+        book_id = book_info["id"]
+        self._known_book_ids.add(book_id)
+        with self._book_cache_lock:
+            self._book_cache[book_id] = (time.monotonic(), book_info)
+            self._book_cache.move_to_end(book_id)
+            while len(self._book_cache) > self.BOOK_CACHE_SIZE:
+                self._book_cache.popitem(last=False)
+
+    def _invalidate_book(self, book_id, deleted=False):
+        """Drop a book from the get_book cache after it was written to."""
+        with self._book_cache_lock:
+            self._book_cache.pop(book_id, None)
+        if deleted:
+            self._known_book_ids.discard(book_id)
+
+    def _book_exists(self, book_id):
+        """
+        Cheap existence check for hot paths that don't need the book row.
+
+        IDs are remembered once seen, so repeated calls for the same book
+        cost no query at all.
+        """
+        if book_id in self._known_book_ids:
+            return True
+        try:
+            conn = self.backend.get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM books WHERE id = ?", (book_id,))
+            exists = cursor.fetchone() is not None
+            conn.close()
+        except Exception as e:
+            self.logger.error(f"Error checking book existence: {e}")
+            return False
+        if exists:
+            self._known_book_ids.add(book_id)
+        return exists
     
     # End Book management section    
     
@@ -505,7 +743,7 @@ class DatabaseManager:
                     summary=None, translation_model=None):
         """
         Save a chapter to the database.
-        
+
         Args:
             book_id: Book ID
             chapter_number: Chapter number
@@ -514,95 +752,112 @@ class DatabaseManager:
             translated_content: Translated text (list of lines)
             summary: Chapter summary (optional)
             translation_model: Model used for translation (optional)
-            
+
         Returns:
             int: Chapter ID if successful, None otherwise
         """
+        chapter_ids = self.save_chapters_bulk(book_id, [{
+            "chapter_number": chapter_number,
+            "title": title,
+            "untranslated_content": untranslated_content,
+            "translated_content": translated_content,
+            "summary": summary,
+            "translation_model": translation_model,
+        }])
+        return chapter_ids[0] if chapter_ids else None
+
+    def save_chapters_bulk(self, book_id, chapters):
+        """
+        Save several chapters of one book in a single transaction.
+
+        Args:
+            book_id: Book ID
+            chapters: Iterable of dicts with the save_chapter arguments
+                      (chapter_number, title, untranslated_content,
+                      translated_content, and optionally summary and
+                      translation_model)
+
+        Returns:
+            list: Chapter IDs in input order if successful, None otherwise
+        """
+        # A missing book is caught by the chapters.book_id foreign key on
+        # insert rather than by a separate lookup beforehand
         try:
-            # Get book info to make sure it exists
-            book = self.get_book(book_id=book_id)
-            if not book:
-                self.logger.error(f"Book with ID {book_id} not found")
-                return None
-            
-            # Serialize content if it's a list
-            if isinstance(untranslated_content, list):
-                untranslated_text = json.dumps(untranslated_content, ensure_ascii=False)
-            else:
-                untranslated_text = untranslated_content
-                
-            if isinstance(translated_content, list):
-                translated_text = json.dumps(translated_content, ensure_ascii=False)
-            else:
-                translated_text = translated_content
-            
-            # Current timestamp
+            # Current timestamp, shared by the whole batch
             timestamp = datetime.datetime.now().isoformat()
-            
+
             # Get current translation model if not specified
-            if translation_model is None:
-                translation_model = self.config.translation_model
-                
+            default_model = self.config.translation_model
+
+            # Serialize content if it's a list
+            rows = [
+                (
+                    ch["chapter_number"],
+                    ch["title"],
+                    _json_dumps(ch["untranslated_content"])
+                    if isinstance(ch["untranslated_content"], list) else ch["untranslated_content"],
+                    _json_dumps(ch["translated_content"])
+                    if isinstance(ch["translated_content"], list) else ch["translated_content"],
+                    ch.get("summary"),
+                    ch.get("translation_model") or default_model,
+                )
+                for ch in chapters
+            ]
+            if not rows:
+                return []
+            chapter_numbers = [row[0] for row in rows]
+
             conn = self.backend.get_connection()
             cursor = conn.cursor()
-            
-            # Check if chapter already exists
-            cursor.execute('''
-            SELECT id FROM chapters 
-            WHERE book_id = ? AND chapter_number = ?
-            ''', (book_id, chapter_number))
-            
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing chapter
-                chapter_id = existing[0]
-                
-                cursor.execute('''
-                UPDATE chapters
-                SET title = ?, untranslated_content = ?, translated_content = ?, 
-                    summary = ?, translation_date = ?, translation_model = ?
-                WHERE id = ?
-                ''', (title, untranslated_text, translated_text, summary, timestamp, 
-                    translation_model, chapter_id))
-                    
-                # Update book modified date
-                cursor.execute('''
-                UPDATE books
-                SET modified_date = ?
-                WHERE id = ?
-                ''', (timestamp, book_id))
-                
-                self.logger.info(f"Updated chapter {chapter_number} for book ID {book_id}")
+
+            # Insert new chapters or update existing ones in place (keeps their IDs)
+            params = [
+                (book_id, number, title, untranslated_text, translated_text, summary, timestamp, model)
+                for number, title, untranslated_text, translated_text, summary, model in rows
+            ]
+            if len(params) == 1 and (self.backend.supports_returning or self.backend.name != 'sqlite'):
+                cursor.execute(self.backend.upsert_chapter_sql(returning_id=True), params[0])
+                if self.backend.supports_returning:
+                    chapter_ids = {chapter_numbers[0]: cursor.fetchone()[0]}
+                else:
+                    chapter_ids = {chapter_numbers[0]: cursor.lastrowid}
             else:
-                # Insert new chapter
-                cursor.execute('''
-                INSERT INTO chapters
-                (book_id, chapter_number, title, untranslated_content, translated_content, 
-                summary, translation_date, translation_model)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (book_id, chapter_number, title, untranslated_text, translated_text, 
-                    summary, timestamp, translation_model))
-                    
-                chapter_id = cursor.lastrowid
-                
-                # Update book modified date
-                cursor.execute('''
-                UPDATE books
-                SET modified_date = ?
-                WHERE id = ?
-                ''', (timestamp, book_id))
-                
-                self.logger.info(f"Added chapter {chapter_number} to book ID {book_id}")
-            
+                cursor.executemany(self.backend.upsert_chapter_sql(), params)
+                if len(chapter_numbers) <= 500:
+                    placeholders = ", ".join("?" * len(chapter_numbers))
+                    cursor.execute(f'''
+                    SELECT chapter_number, id FROM chapters
+                    WHERE book_id = ? AND chapter_number IN ({placeholders})
+                    ''', (book_id, *chapter_numbers))
+                else:
+                    cursor.execute('''
+                    SELECT chapter_number, id FROM chapters
+                    WHERE book_id = ?
+                    ''', (book_id,))
+                chapter_ids = dict(cursor.fetchall())
+
+            # Update book modified date
+            cursor.execute('''
+            UPDATE books
+            SET modified_date = ?
+            WHERE id = ?
+            ''', (timestamp, book_id))
+
             conn.commit()
             conn.close()
+            self._invalidate_book(book_id)
             self.invalidate_epub_cache(book_id)
 
-            return chapter_id
+            for number in chapter_numbers:
+                self.logger.info(f"Saved chapter {number} for book ID {book_id}")
+
+            return [chapter_ids[number] for number in chapter_numbers]
 
         except Exception as e:
-            self.logger.error(f"Error saving chapter: {e}")
+            if self.backend.is_foreign_key_error(e):
+                self.logger.error(f"Book with ID {book_id} not found")
+            else:
+                self.logger.error(f"Error saving chapter: {e}")
             return None
 
     def get_chapter(self, chapter_id=None, book_id=None, chapter_number=None):
@@ -623,6 +878,7 @@ class DatabaseManager:
             
         try:
             conn = self.backend.get_connection()
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
             if chapter_id:
@@ -651,28 +907,21 @@ class DatabaseManager:
                 return None
                 
             # Deserialize JSON content
-            try:
-                untranslated_content = json.loads(row[4])
-            except json.JSONDecodeError:
-                untranslated_content = row[4].split('\n')
-                
-            try:
-                translated_content = json.loads(row[5])
-            except json.JSONDecodeError:
-                translated_content = row[5].split('\n')
+            untranslated_content = _decode_lines(row["untranslated_content"])
+            translated_content = _decode_lines(row["translated_content"])
                 
             chapter_data = {
-                "id": row[0],
-                "book_id": row[1],
-                "chapter": row[2],
-                "title": row[3],
+                "id": row["id"],
+                "book_id": row["book_id"],
+                "chapter": row["chapter_number"],
+                "title": row["title"],
                 "untranslated": untranslated_content,
                 "content": translated_content,
-                "summary": row[6],
-                "translation_date": row[7],
-                "model": row[8],
-                "book_title": row[9],
-                "is_proofread": row[10],
+                "summary": row["summary"],
+                "translation_date": row["translation_date"],
+                "model": row["translation_model"],
+                "book_title": row["book_title"],
+                "is_proofread": row["is_proofread"],
             }
             
             return chapter_data
@@ -681,6 +930,67 @@ class DatabaseManager:
             self.logger.error(f"Error retrieving chapter data: {e}")
             return None
 
+    def get_chapter_metadata(self, chapter_id=None, book_id=None, chapter_number=None):
+        """
+        Get chapter metadata without loading its (potentially large) content.
+
+        Args:
+            chapter_id: Chapter ID (optional if book_id and chapter_number are provided)
+            book_id: Book ID (required if chapter_id is not provided)
+            chapter_number: Chapter number (required if chapter_id is not provided)
+
+        Returns:
+            dict: Same as get_chapter() minus "untranslated" and "content",
+                  or None if not found
+        """
+        if not chapter_id and (not book_id or not chapter_number):
+            self.logger.error("Either chapter_id or both book_id and chapter_number must be provided")
+            return None
+
+        try:
+            conn = self.backend.get_connection()
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            if chapter_id:
+                cursor.execute('''
+                SELECT c.id, c.book_id, c.chapter_number, c.title, c.summary,
+                    c.translation_date, c.translation_model, b.title as book_title, c.is_proofread
+                FROM chapters c
+                JOIN books b ON c.book_id = b.id
+                WHERE c.id = ?
+                ''', (chapter_id,))
+            else:
+                cursor.execute('''
+                SELECT c.id, c.book_id, c.chapter_number, c.title, c.summary,
+                    c.translation_date, c.translation_model, b.title as book_title, c.is_proofread
+                FROM chapters c
+                JOIN books b ON c.book_id = b.id
+                WHERE c.book_id = ? AND c.chapter_number = ?
+                ''', (book_id, chapter_number))
+
+            row = cursor.fetchone()
+            conn.close()
+
+            if not row:
+                return None
+
+            return {
+                "id": row["id"],
+                "book_id": row["book_id"],
+                "chapter": row["chapter_number"],
+                "title": row["title"],
+                "summary": row["summary"],
+                "translation_date": row["translation_date"],
+                "model": row["translation_model"],
+                "book_title": row["book_title"],
+                "is_proofread": row["is_proofread"],
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error retrieving chapter metadata: {e}")
+            return None
+
     def list_chapters(self, book_id):
         """
         List all chapters for a specific book.
@@ -692,14 +1002,37 @@ class DatabaseManager:
             list: List of chapter metadata dictionaries
         """
         try:
-            # Verify book exists
-            book = self.get_book(book_id=book_id)
-            if not book:
-                self.logger.warning(f"Book with ID {book_id} not found")
-                return []
-                
-            conn = self.backend.get_connection()
+            return list(self.iter_chapters(book_id))
+            
+        except Exception as e:
+            self.logger.error(f"Error listing chapters: {e}")
+            return []
+
+    def iter_chapters(self, book_id, batch_size=256):
+        """
+        Yield chapter metadata dictionaries for a book, in chapter order.
+        
+        Rows are fetched from the cursor in batches, so callers that consume
+        lazily never hold the whole list in memory. Database errors propagate
+        to the caller (list_chapters logs them and returns []).
+        
+        Args:
+            book_id: Book ID
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            dict: Chapter metadata (same shape as list_chapters entries)
+        """
+        # Verify book exists
+        if not self._book_exists(book_id):
+            self.logger.warning(f"Book with ID {book_id} not found")
+            return
+            
+        conn = self.backend.get_connection()
+        try:
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.arraysize = batch_size
             
             cursor.execute('''
             SELECT id, chapter_number, title, translation_date, translation_model, is_proofread
@@ -708,27 +1041,22 @@ class DatabaseManager:
             ORDER BY chapter_number
             ''', (book_id,))
 
-            rows = cursor.fetchall()
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield {
+                        "id": row["id"],
+                        "chapter": row["chapter_number"],
+                        "title": row["title"],
+                        "translation_date": row["translation_date"],
+                        "model": row["translation_model"],
+                        "is_proofread": row["is_proofread"],
+                    }
+        finally:
             conn.close()
 
-            result = []
-            for row in rows:
-                chapter_id, chapter_number, title, translation_date, model, is_proofread = row
-                result.append({
-                    "id": chapter_id,
-                    "chapter": chapter_number,
-                    "title": title,
-                    "translation_date": translation_date,
-                    "model": model,
-                    "is_proofread": is_proofread,
-                })
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error listing chapters: {e}")
-            return []
-
     def search_book_chapters(self, book_id, query, scope='both', is_regex=False):
         """Search all chapters of a book for a query string.
 
@@ -761,14 +1089,8 @@ class DatabaseManager:
 
             results = []
             for chapter_number, title, raw_untrans, raw_trans in rows:
-                try:
-                    untrans_lines = json.loads(raw_untrans) if raw_untrans else []
-                except (json.JSONDecodeError, TypeError):
-                    untrans_lines = raw_untrans.split('\n') if raw_untrans else []
-                try:
-                    trans_lines = json.loads(raw_trans) if raw_trans else []
-                except (json.JSONDecodeError, TypeError):
-                    trans_lines = raw_trans.split('\n') if raw_trans else []
+                untrans_lines = _decode_lines(raw_untrans)
+                trans_lines = _decode_lines(raw_trans)
 
                 matches = []
 
@@ -871,10 +1193,7 @@ class DatabaseManager:
             snapshots = []
 
             for ch_id, ch_num, raw_content in rows:
-                try:
-                    lines = json.loads(raw_content) if raw_content else []
-                except (json.JSONDecodeError, TypeError):
-                    lines = raw_content.split('\n') if raw_content else []
+                lines = _decode_lines(raw_content)
 
                 ch_replacements = 0
                 new_lines = []
@@ -908,7 +1227,7 @@ class DatabaseManager:
                     snapshots.append((ch_id, raw_content))
                     cursor.execute(
                         'UPDATE chapters SET translated_content = ? WHERE id = ?',
-                        (json.dumps(new_lines, ensure_ascii=False), ch_id)
+                        (_json_dumps(new_lines), ch_id)
                     )
                     affected += 1
                     total += ch_replacements
@@ -984,52 +1303,48 @@ class DatabaseManager:
         try:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
-            
-            # Get chapter details first (for logging)
+
             if chapter_id:
-                cursor.execute('''
-                SELECT book_id, chapter_number, title FROM chapters WHERE id = ?
-                ''', (chapter_id,))
+                where, params = "id = ?", (chapter_id,)
             else:
-                cursor.execute('''
-                SELECT id, title FROM chapters WHERE book_id = ? AND chapter_number = ?
-                ''', (book_id, chapter_number))
-                
-            chapter = cursor.fetchone()
-            
+                where, params = "book_id = ? AND chapter_number = ?", (book_id, chapter_number)
+
+            # Delete the chapter, getting its details back (for logging)
+            if self.backend.supports_returning:
+                cursor.execute(f'''
+                DELETE FROM chapters WHERE {where}
+                RETURNING id, book_id, chapter_number, title
+                ''', params)
+                chapter = cursor.fetchone()
+            else:
+                cursor.execute(f'''
+                SELECT id, book_id, chapter_number, title FROM chapters WHERE {where}
+                ''', params)
+                chapter = cursor.fetchone()
+                if chapter:
+                    cursor.execute("DELETE FROM chapters WHERE id = ?", (chapter[0],))
+
             if not chapter:
                 self.logger.warning("Chapter not found")
                 conn.close()
                 return False
-                
-            # Delete the chapter
-            if chapter_id:
-                cursor.execute("DELETE FROM chapters WHERE id = ?", (chapter_id,))
-            else:
-                cursor.execute('''
-                DELETE FROM chapters WHERE book_id = ? AND chapter_number = ?
-                ''', (book_id, chapter_number))
-            
+
+            chapter_id, book_id, chapter_number, title = chapter
+
             # Update book modified date
             timestamp = datetime.datetime.now().isoformat()
-            
-            if chapter_id:
-                book_id = chapter[0]
-            
             cursor.execute('''
             UPDATE books
             SET modified_date = ?
             WHERE id = ?
             ''', (timestamp, book_id))
-            
+
             conn.commit()
             conn.close()
+            self._invalidate_book(book_id)
             self.invalidate_epub_cache(book_id)
 
-            if chapter_id:
-                self.logger.info(f"Deleted chapter {chapter[1]}: '{chapter[2]}' from book ID {chapter[0]}")
-            else:
-                self.logger.info(f"Deleted chapter {chapter_number} (ID: {chapter[0]}): '{chapter[1]}' from book ID {book_id}")
+            self.logger.info(f"Deleted chapter {chapter_number} (ID: {chapter_id}): '{title}' from book ID {book_id}")
 
             return True
 
@@ -1056,66 +1371,144 @@ class DatabaseManager:
         Returns:
             int: Queue item ID if successful, None otherwise
         """
+        # A missing book is caught by the queue.book_id foreign key on insert
         try:
-            # Verify book exists
-            book = self.get_book(book_id=book_id)
-            if not book:
-                self.logger.error(f"Book with ID {book_id} not found")
-                return None
-
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
+            # Position is computed inside the INSERT itself, so there is no
+            # separate MIN/MAX round trip and no window for a concurrent
+            # insert to grab the same position
             if priority:
                 # Place at front: use min(position) - 1
-                cursor.execute('SELECT MIN(position) FROM queue')
-                min_pos = cursor.fetchone()[0]
-                next_position = (min_pos - 1) if min_pos is not None else 0
+                position_sql = 'COALESCE(MIN(position) - 1, 0)'
             else:
                 # Place at back: use max(position) + 1
-                cursor.execute('SELECT MAX(position) FROM queue')
-                max_pos = cursor.fetchone()[0]
-                next_position = (max_pos + 1) if max_pos is not None else 0
+                position_sql = 'COALESCE(MAX(position) + 1, 0)'
 
             # Serialize content as JSON if list (like chapters table)
             if isinstance(content, list):
-                content_json = json.dumps(content, ensure_ascii=False)
+                content_json = _json_dumps(content)
             else:
                 content_json = content
 
             # Serialize metadata if provided
-            metadata_json = json.dumps(metadata, ensure_ascii=False) if metadata else None
+            metadata_json = _json_dumps(metadata) if metadata else None
 
             # Get current timestamp
-            from datetime import datetime
-            created_date = datetime.now().isoformat()
+            created_date = datetime.datetime.now().isoformat()
 
             # Normalize reason: treat empty/whitespace as None
             reason = (retranslation_reason or "").strip() or None
 
             # Insert queue item
-            cursor.execute('''
+            cursor.execute(f'''
             INSERT INTO queue (book_id, chapter_number, title, source, content, metadata, position, created_date, retranslation_reason)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (book_id, chapter_number, title or "Untitled", source, content_json, metadata_json, next_position, created_date, reason))
+            SELECT ?, ?, ?, ?, ?, ?, {position_sql}, ?, ? FROM queue
+            ''', (book_id, chapter_number, title or "Untitled", source, content_json, metadata_json, created_date, reason))
 
             queue_id = cursor.lastrowid
             conn.commit()
             conn.close()
+            self._invalidate_queue_cache()
 
-            self.logger.info(f"Added item to queue (ID: {queue_id}, position: {next_position}) for book '{book['title']}'")
+            self.logger.info(f"Added item to queue (ID: {queue_id}) for book ID {book_id}")
             return queue_id
 
         except Exception as e:
-            self.logger.error(f"Error adding to queue: {e}")
+            if self.backend.is_foreign_key_error(e):
+                self.logger.error(f"Book with ID {book_id} not found")
+            else:
+                self.logger.error(f"Error adding to queue: {e}")
+            return None
+
+    def add_many_to_queue(self, items):
+        """
+        Append several items to the back of the translation queue at once.
+
+        Positions are allocated with a single MAX(position) lookup and the
+        rows are written with one executemany, all in one transaction, so a
+        large import doesn't contend on the queue tail once per chapter.
+
+        Args:
+            items: Iterable of dicts with the add_to_queue arguments
+                   (book_id and content required; title, chapter_number,
+                   source, metadata and retranslation_reason optional)
+
+        Returns:
+            list: Queue item IDs in input order if successful, None otherwise
+        """
+        # Serialize everything up front so the transaction only covers SQL
+        created_date = datetime.datetime.now().isoformat()
+        rows = [
+            (
+                item["book_id"],
+                item.get("chapter_number"),
+                item.get("title") or "Untitled",
+                item.get("source"),
+                _json_dumps(item["content"])
+                if isinstance(item["content"], list) else item["content"],
+                _json_dumps(item["metadata"]) if item.get("metadata") else None,
+                created_date,
+                (item.get("retranslation_reason") or "").strip() or None,
+            )
+            for item in items
+        ]
+        if not rows:
+            return []
+
+        try:
+            conn = self.backend.get_connection()
+            cursor = conn.cursor()
+
+            # Take the write lock before reading the tail position, so no
+            # concurrent insert can be handed the same positions
+            if self.backend.name == 'sqlite':
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM queue")
+            else:
+                cursor.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM queue FOR UPDATE")
+            base = cursor.fetchone()[0]
+
+            cursor.executemany('''
+            INSERT INTO queue (book_id, chapter_number, title, source, content, metadata, created_date, retranslation_reason, position)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [row + (base + i,) for i, row in enumerate(rows)])
+
+            cursor.execute('''
+            SELECT id FROM queue
+            WHERE position >= ? AND position < ?
+            ORDER BY position
+            ''', (base, base + len(rows)))
+            queue_ids = [row[0] for row in cursor.fetchall()]
+
+            conn.commit()
+            conn.close()
+            self._invalidate_queue_cache()
+
+            self.logger.info(f"Added {len(queue_ids)} items to queue")
+            return queue_ids
+
+        except Exception as e:
+            if self.backend.is_foreign_key_error(e):
+                self.logger.error("Book not found for one or more queue items")
+            else:
+                self.logger.error(f"Error adding to queue: {e}")
             return None
 
-    def get_next_queue_item(self, book_id=None):
+    def _invalidate_queue_cache(self):
+        """Drop cached queue counts and duplicate checks after a queue write."""
+        self._queue_count_cache.clear()
+        self._queue_dup_cache.clear()
+
+    def get_next_queue_item(self, book_id=None, last_position=None):
         """
         Get the next item from the queue (lowest position).
 
         Args:
             book_id: Optional book ID to filter by specific book
+            last_position: Optional position to resume after; returns the first
+                item positioned after it (keyset seek on the position index)
 
         Returns:
             dict: Queue item data or None if queue empty
@@ -1124,28 +1517,27 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
-            # Build query with optional book_id filter
+            # Build query with optional book_id / keyset filters
+            conditions = []
+            params = []
             if book_id:
-                cursor.execute('''
-                SELECT q.id, q.book_id, q.chapter_number, q.title, q.source, q.content,
-                       q.metadata, q.position, q.created_date, b.title as book_title,
-                       q.retranslation_reason
-                FROM queue q
-                JOIN books b ON q.book_id = b.id
-                WHERE q.book_id = ?
-                ORDER BY q.position ASC
-                LIMIT 1
-                ''', (book_id,))
-            else:
-                cursor.execute('''
-                SELECT q.id, q.book_id, q.chapter_number, q.title, q.source, q.content,
-                       q.metadata, q.position, q.created_date, b.title as book_title,
-                       q.retranslation_reason
-                FROM queue q
-                JOIN books b ON q.book_id = b.id
-                ORDER BY q.position ASC
-                LIMIT 1
-                ''')
+                conditions.append('q.book_id = ?')
+                params.append(book_id)
+            if last_position is not None:
+                conditions.append('q.position > ?')
+                params.append(last_position)
+            where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+            cursor.execute(f'''
+            SELECT q.id, q.book_id, q.chapter_number, q.title, q.source, q.content,
+                   q.metadata, q.position, q.created_date, b.title as book_title,
+                   q.retranslation_reason
+            FROM queue q
+            JOIN books b ON q.book_id = b.id
+            {where_sql}
+            ORDER BY q.position ASC
+            LIMIT 1
+            ''', params)
 
             row = cursor.fetchone()
             conn.close()
@@ -1153,21 +1545,12 @@ class DatabaseManager:
             if not row:
                 return None
 
-            # Deserialize content (like get_chapter)
-            content_json = row[5]
-            try:
-                content = json.loads(content_json)
-            except:
-                content = content_json  # Fallback to string if not valid JSON
+            # Deserialize content (like get_chapter), falling back to the
+            # stored string if it isn't JSON
+            content = _load_json_column(row[5], row[5])
 
             # Deserialize metadata if present
-            metadata_json = row[6]
-            metadata = None
-            if metadata_json:
-                try:
-                    metadata = json.loads(metadata_json)
-                except:
-                    pass
+            metadata = _load_json_column(row[6], None)
 
             return {
                 'id': row[0],
@@ -1201,9 +1584,16 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
-            # Get the position of the item being removed
-            cursor.execute('SELECT position FROM queue WHERE id = ?', (queue_id,))
-            row = cursor.fetchone()
+            # Delete the item, getting its position back for logging
+            # (no need to reorder — gaps in position are fine)
+            if self.backend.supports_returning:
+                cursor.execute('DELETE FROM queue WHERE id = ? RETURNING position', (queue_id,))
+                row = cursor.fetchone()
+            else:
+                cursor.execute('SELECT position FROM queue WHERE id = ?', (queue_id,))
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute('DELETE FROM queue WHERE id = ?', (queue_id,))
 
             if not row:
                 self.logger.warning(f"Queue item {queue_id} not found")
@@ -1212,11 +1602,9 @@ class DatabaseManager:
 
             removed_position = row[0]
 
-            # Delete the item (no need to reorder — gaps in position are fine)
-            cursor.execute('DELETE FROM queue WHERE id = ?', (queue_id,))
-
             conn.commit()
             conn.close()
+            self._invalidate_queue_cache()
 
             self.logger.info(f"Removed queue item {queue_id} from position {removed_position}")
             return True
@@ -1236,8 +1624,32 @@ class DatabaseManager:
             list: List of queue item dicts ordered by position
         """
         try:
-            conn = self.backend.get_connection()
+            return list(self.iter_queue(book_id))
+
+        except Exception as e:
+            self.logger.error(f"Error listing queue: {e}")
+            return []
+
+    def iter_queue(self, book_id=None, batch_size=256):
+        """
+        Yield queue item dicts in position order.
+
+        Rows (with their chapter content) are fetched in batches, so callers
+        that consume lazily never hold the whole queue in memory. Database
+        errors propagate to the caller (list_queue logs them and returns []).
+
+        Args:
+            book_id: Optional book ID to filter by specific book
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            dict: Queue item (same shape as list_queue entries)
+        """
+        conn = self.backend.get_connection()
+        try:
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.arraysize = batch_size
 
             # Build query with optional book_id filter
             if book_id:
@@ -1260,47 +1672,33 @@ class DatabaseManager:
                 ORDER BY q.position ASC
                 ''')
 
-            rows = cursor.fetchall()
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    # Deserialize content
+                    content = _load_json_column(row["content"], row["content"])
+
+                    # Deserialize metadata if present
+                    metadata = _load_json_column(row["metadata"], None)
+
+                    yield {
+                        'id': row["id"],
+                        'book_id': row["book_id"],
+                        'chapter_number': row["chapter_number"],
+                        'title': row["title"],
+                        'source': row["source"],
+                        'content': content,
+                        'metadata': metadata,
+                        'position': row["position"],
+                        'created_date': row["created_date"],
+                        'book_title': row["book_title"],
+                        'retranslation_reason': row["retranslation_reason"],
+                    }
+        finally:
             conn.close()
 
-            result = []
-            for row in rows:
-                # Deserialize content
-                content_json = row[5]
-                try:
-                    content = json.loads(content_json)
-                except:
-                    content = content_json
-
-                # Deserialize metadata if present
-                metadata_json = row[6]
-                metadata = None
-                if metadata_json:
-                    try:
-                        metadata = json.loads(metadata_json)
-                    except:
-                        pass
-
-                result.append({
-                    'id': row[0],
-                    'book_id': row[1],
-                    'chapter_number': row[2],
-                    'title': row[3],
-                    'source': row[4],
-                    'content': content,
-                    'metadata': metadata,
-                    'position': row[7],
-                    'created_date': row[8],
-                    'book_title': row[9],
-                    'retranslation_reason': row[10],
-                })
-
-            return result
-
-        except Exception as e:
-            self.logger.error(f"Error listing queue: {e}")
-            return []
-
     def clear_queue(self, book_id=None):
         """
         Clear the queue (all items or for specific book).
@@ -1316,18 +1714,10 @@ class DatabaseManager:
             cursor = conn.cursor()
 
             if book_id:
-                # Clear queue for specific book
+                # Clear queue for specific book (no need to reorder the
+                # remaining items — gaps in position are fine)
                 cursor.execute('DELETE FROM queue WHERE book_id = ?', (book_id,))
                 count = cursor.rowcount
-
-                # Reorder positions after deletion
-                # Get all remaining items ordered by position
-                cursor.execute('SELECT id FROM queue ORDER BY position ASC')
-                items = cursor.fetchall()
-
-                # Update positions to be sequential
-                for i, (item_id,) in enumerate(items):
-                    cursor.execute('UPDATE queue SET position = ? WHERE id = ?', (i, item_id))
             else:
                 # Clear entire queue
                 cursor.execute('DELETE FROM queue')
@@ -1335,6 +1725,7 @@ class DatabaseManager:
 
             conn.commit()
             conn.close()
+            self._invalidate_queue_cache()
 
             self.logger.info(f"Cleared {count} items from queue" + (f" for book_id {book_id}" if book_id else ""))
             return count
@@ -1353,6 +1744,10 @@ class DatabaseManager:
         Returns:
             int: Number of items in queue
         """
+        cached = self._queue_count_cache.get(book_id)
+        if cached and time.monotonic() - cached[0] < self.QUEUE_CACHE_TTL:
+            return cached[1]
+
         try:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
@@ -1365,6 +1760,7 @@ class DatabaseManager:
             count = cursor.fetchone()[0]
             conn.close()
 
+            self._queue_count_cache[book_id] = (time.monotonic(), count)
             return count
 
         except Exception as e:
@@ -1382,22 +1778,58 @@ class DatabaseManager:
         Returns:
             bool: True if duplicate exists
         """
+        key = (book_id, chapter_number)
+        cached = self._queue_dup_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.QUEUE_CACHE_TTL:
+            return cached[1]
+
         try:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
-            cursor.execute('SELECT id FROM queue WHERE book_id = ? AND chapter_number = ?',
+            cursor.execute('SELECT 1 FROM queue WHERE book_id = ? AND chapter_number = ? LIMIT 1',
                           (book_id, chapter_number))
 
             result = cursor.fetchone()
             conn.close()
 
+            if len(self._queue_dup_cache) >= 1024:
+                self._queue_dup_cache.clear()
+            self._queue_dup_cache[key] = (time.monotonic(), result is not None)
             return result is not None
 
         except Exception as e:
             self.logger.error(f"Error checking duplicate in queue: {e}")
             return False
 
+    def get_queued_chapters(self, book_id=None):
+        """
+        Get the chapters currently in the queue, for checking many at once.
+
+        Args:
+            book_id: Optional book ID to restrict to a specific book
+
+        Returns:
+            set: (book_id, chapter_number) pairs of queued items
+        """
+        try:
+            conn = self.backend.get_connection()
+            cursor = conn.cursor()
+
+            if book_id:
+                cursor.execute('SELECT book_id, chapter_number FROM queue WHERE book_id = ?', (book_id,))
+            else:
+                cursor.execute('SELECT book_id, chapter_number FROM queue')
+
+            queued = set(cursor.fetchall())
+            conn.close()
+
+            return queued
+
+        except Exception as e:
+            self.logger.error(f"Error getting queued chapters: {e}")
+            return set()
+
     # ------------------------------------------------------------------
     # Activity log
     # ------------------------------------------------------------------
@@ -1500,11 +1932,22 @@ class DatabaseManager:
 
     def _check_legacy_queue(self):
         """Check for legacy queue.json and warn user"""
+        global _legacy_queue_checked
+        # Once per process: every DatabaseManager would find the same file
+        if _legacy_queue_checked:
+            return
+        _legacy_queue_checked = True
+
         queue_path = os.path.join(self.config.script_dir, "queue.json")
-        if os.path.exists(queue_path):
+        try:
+            size = os.stat(queue_path).st_size
+        except OSError:
+            return
+        # Too small to hold even one queued item (e.g. "[]")
+        if size >= 4:
             try:
-                with open(queue_path, 'r', encoding='utf-8') as f:
-                    legacy_queue = json.load(f)
+                with open(queue_path, 'rb') as f:
+                    legacy_queue = _json_loads(f.read())
 
                 if legacy_queue and len(legacy_queue) > 0:
                     self.logger.warning(f"Found legacy queue.json with {len(legacy_queue)} items")
@@ -1553,14 +1996,15 @@ class DatabaseManager:
                 ''')
 
             rows = cursor.fetchall()
+            conn.close()
 
-            # Process results
+            # Process results in one pass over the prefetched rows
             entities = default_entities.copy()
-            for row in rows:
-                category, untranslated, translation, last_chapter, incorrect_translation, gender, entity_book_id, note = row
-
-                # Initialize category if needed (should be unnecessary with defaults)
-                entities.setdefault(category, {})
+            for category, untranslated, translation, last_chapter, incorrect_translation, gender, entity_book_id, note in rows:
+                bucket = entities.get(category)
+                if bucket is None:
+                    # Initialize category if needed (should be unnecessary with defaults)
+                    bucket = entities[category] = {}
 
                 # Create entity entry
                 entity_data = {"translation": translation, "last_chapter": last_chapter}
@@ -1574,11 +2018,10 @@ class DatabaseManager:
                     entity_data["book_id"] = entity_book_id
                 if note:
                     entity_data["note"] = note
-                
+
                 # Add to our entities dictionary
-                entities[category][untranslated] = entity_data
-            
-            conn.close()
+                bucket[untranslated] = entity_data
+
             self.entities = entities
             self.logger.debug(f"Loaded {sum(len(cat) for cat in entities.values())} entities from database")
             return entities
@@ -1597,8 +2040,9 @@ class DatabaseManager:
             return default or {}
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            # Read bytes and let the parser do the UTF-8 decoding
+            with open(full_path, 'rb') as file:
+                return _json_loads(file.read())
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to decode JSON from file '{filepath}': {e}")
             return default or {}
@@ -1606,13 +2050,24 @@ class DatabaseManager:
             self.logger.error(f"Failed to read file '{filepath}': {e}")
             return default or {}
     
-    def save_json_file(self, filepath, data):
-        """Save data to a JSON file with error handling"""
+    def save_json_file(self, filepath, data, pretty=True):
+        """Save data to a JSON file with error handling (compact when pretty=False)"""
         full_path = os.path.join(self.config.script_dir, filepath)
         
         try:
-            with open(full_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                # orjson writes UTF-8 bytes directly (its only indent width is 2)
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                with open(full_path, 'wb') as file:
+                    file.write(orjson.dumps(data, option=option))
+            elif pretty:
+                with open(full_path, 'w', encoding='utf-8') as file:
+                    json.dump(data, file, indent=4, ensure_ascii=False)
+            else:
+                with open(full_path, 'w', encoding='utf-8') as file:
+                    json.dump(data, file, separators=(',', ':'), ensure_ascii=False)
         except OSError as e:
             self.logger.error(f"Failed to write to file '{filepath}': {e}")
     
@@ -1623,76 +2078,72 @@ class DatabaseManager:
         of untranslated-translated pairs. Entries from 'new_entities' will replace
         existing ones from 'old_entities' if they have the same keys.
         """
-        # Create a copy using union of keys from both dicts
-        all_categories = set(old_entities.keys()) | set(new_entities.keys())
-        result = {cat: old_entities.get(cat, {}).copy() for cat in all_categories}
-
-        # Update with new entities
-        for cat in all_categories:
-            new_category_dict = new_entities.get(cat, {})
-            result.setdefault(cat, {}).update(new_category_dict)
-
-        return result
+        # Categories come from the data (books can define their own), in
+        # old-then-new order; dict | builds each merged copy in one step
+        return {
+            cat: old_entities.get(cat, {}) | new_entities.get(cat, {})
+            for cat in {**old_entities, **new_entities}
+        }
     
     def save_entities(self):
         """Save the current entities cache to the SQLite database"""
         try:
-            conn = self.backend.get_connection()
-            cursor = conn.cursor()
-            
-            # Track which entities we've already saved to avoid duplicates
-            processed_entities = set()
-            
-            # For each category and entity in memory cache
+            # One row per (untranslated, book_id); if an entity appears under
+            # several categories, the first one seen wins
+            rows = {}
             for category, entities in self.entities.items():
                 for untranslated, entity_data in entities.items():
-                    translation = entity_data.get('translation', '')
-                    last_chapter = entity_data.get('last_chapter', '')
-                    incorrect_translation = entity_data.get('incorrect_translation', None)
-                    gender = entity_data.get('gender', None)
-                    book_id = entity_data.get('book_id', None)  # Include book_id
-                    note = entity_data.get('note', None)
-                    
-                    # Create a unique key to track this entity
-                    entity_key = (untranslated, book_id)
-
-                    # Skip if we've already processed this entity
-                    if entity_key in processed_entities:
-                        continue
-
-                    # Add to processed set
-                    processed_entities.add(entity_key)
-
-                    # Look for existing entity to determine whether to insert or update
-                    if book_id is not None:
-                        cursor.execute('''
-                        SELECT id FROM entities
-                        WHERE untranslated = ? AND book_id = ?
-                        ''', (untranslated, book_id))
-                    else:
-                        cursor.execute('''
-                        SELECT id FROM entities
-                        WHERE untranslated = ? AND book_id IS NULL
-                        ''', (untranslated,))
-                    
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        # Update existing entity
-                        entity_id = existing[0]
-                        cursor.execute('''
-                        UPDATE entities
-                        SET category = ?, translation = ?, last_chapter = ?, incorrect_translation = ?, gender = ?, note = ?
-                        WHERE id = ?
-                        ''', (category, translation, last_chapter, incorrect_translation, gender, note, entity_id))
-                    else:
-                        # Insert new entity
-                        cursor.execute('''
-                        INSERT INTO entities
-                        (category, untranslated, translation, last_chapter, incorrect_translation, gender, book_id, note)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (category, untranslated, translation, last_chapter, incorrect_translation, gender, book_id, note))
-            
+                    book_id = entity_data.get('book_id', None)
+                    rows.setdefault((untranslated, book_id), (
+                        category,
+                        untranslated,
+                        entity_data.get('translation', ''),
+                        entity_data.get('last_chapter', ''),
+                        entity_data.get('incorrect_translation', None),
+                        entity_data.get('gender', None),
+                        book_id,
+                        entity_data.get('note', None),
+                    ))
+
+            book_rows = [row for (_, book_id), row in rows.items() if book_id is not None]
+            global_rows = [row for (_, book_id), row in rows.items() if book_id is None]
+
+            conn = self.backend.get_connection()
+            cursor = conn.cursor()
+
+            # Book-specific entities: a single UPSERT on UNIQUE(book_id, untranslated)
+            if book_rows:
+                cursor.executemany(self.backend.upsert_book_entity_sql(), book_rows)
+
+            # Global entities (book_id NULL) can't use the unique constraint,
+            # since NULLs never conflict; look their IDs up in one query instead
+            if global_rows:
+                cursor.execute('''
+                SELECT untranslated, id FROM entities
+                WHERE book_id IS NULL
+                ''')
+                existing = dict(cursor.fetchall())
+
+                updates = [
+                    (category, translation, last_chapter, incorrect_translation, gender, note, existing[untranslated])
+                    for category, untranslated, translation, last_chapter, incorrect_translation, gender, _, note in global_rows
+                    if untranslated in existing
+                ]
+                inserts = [row for row in global_rows if row[1] not in existing]
+
+                if updates:
+                    cursor.executemany('''
+                    UPDATE entities
+                    SET category = ?, translation = ?, last_chapter = ?, incorrect_translation = ?, gender = ?, note = ?
+                    WHERE id = ?
+                    ''', updates)
+                if inserts:
+                    cursor.executemany('''
+                    INSERT INTO entities
+                    (category, untranslated, translation, last_chapter, incorrect_translation, gender, book_id, note)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', inserts)
+
             conn.commit()
             conn.close()
             self.logger.info("Entities saved to database successfully")
@@ -1738,19 +2189,10 @@ class DatabaseManager:
             self.logger.error("all_entities is empty, querying database... we will just return a blank dict for now")
             return {}
         else:
-            all_entities_dict = {}
+            counts = self._entity_matcher(all_entities)(combined_text)
             for key, value in all_entities.items():
-                key_normalized = self._normalize_text(key)
-                
-                regex = re.compile(re.escape(key_normalized))
-                try:
-                    matches = regex.findall(combined_text)
-                    occurrence_count = len(matches)
-                except TypeError as e:
-                    self.logger.error(f"TypeError in regex.findall: {e}")
-                    self.logger.error(f"Key: {key}, Type of combined_text: {type(combined_text)}")
-                    occurrence_count = 0
-                
+                occurrence_count = counts.get(key, 0)
+
                 if occurrence_count > 0:
                     self.logger.debug(f"'{key}' ({value['translation']}) was found {occurrence_count} times.")
                     
@@ -1767,24 +2209,87 @@ class DatabaseManager:
                     all_entities[key]["last_chapter"] = current_chapter
         return found_entities
     
+    def _entity_matcher(self, all_entities):
+        """
+        Return a function mapping normalized text to {entity key: occurrence count}
+        for the keys of all_entities.
+
+        Matchers are cached per entity dict and rebuilt only when its keys
+        change, so each chapter reuses the normalized keys (or Aho-Corasick
+        automaton) from the previous one.
+        """
+        cache_key = id(all_entities)
+        with self._entity_matcher_lock:
+            cached = self._entity_matcher_cache.get(cache_key)
+            if cached is not None and all_entities.keys() == cached[0]:
+                self._entity_matcher_cache.move_to_end(cache_key)
+                return cached[1]
+
+        keys = frozenset(all_entities)
+        if AHOCORASICK_AVAILABLE and len(keys) > 1000:
+            # One linear pass over the text finds every key present (nested
+            # matches included); iter() also reports overlapping matches of
+            # the same key, so occurrences are then counted with str.count to
+            # agree with the per-key branch below
+            by_normalized = {}
+            for key in keys:
+                by_normalized.setdefault(self._normalize_text(key), []).append(key)
+            by_normalized.pop('', None)
+            automaton = ahocorasick.Automaton()
+            for key_normalized, same_keys in by_normalized.items():
+                automaton.add_word(key_normalized, key_normalized)
+            automaton.make_automaton()
+
+            def matcher(text):
+                if not by_normalized:
+                    return {}
+                present = {key_normalized for _, key_normalized in automaton.iter(text)}
+                return {
+                    key: text.count(key_normalized)
+                    for key_normalized in present
+                    for key in by_normalized[key_normalized]
+                }
+        else:
+            # A single alternation regex would miss entities nested inside
+            # longer ones (e.g. a surname inside a full name), so each key
+            # is searched on its own. Keys are literals, so plain substring
+            # search does the job: most keys are absent from any given
+            # chapter and fail the cheap `in` test before anything is counted
+            normalized_keys = [(key, self._normalize_text(key)) for key in keys]
+
+            def matcher(text):
+                return {
+                    key: text.count(key_normalized)
+                    for key, key_normalized in normalized_keys
+                    if key_normalized in text
+                }
+
+        with self._entity_matcher_lock:
+            self._entity_matcher_cache[cache_key] = (keys, matcher)
+            while len(self._entity_matcher_cache) > 64:
+                self._entity_matcher_cache.popitem(last=False)
+        return matcher
+
     def find_new_entities(self, old_data, new_data):
         """
         Return a dictionary of all entities that are present in new_data
         but do NOT exist in old_data at all (in any category).
         """
         # Build a set of all known untranslated keys across every category
-        all_old_keys = set()
-        for cat_entities in old_data.values():
-            all_old_keys.update(cat_entities.keys())
+        all_old_keys = set().union(*old_data.values())
 
         newly_added = {}
 
         for category, new_items in new_data.items():
-            for entity_name, entity_info in new_items.items():
-                if entity_name not in all_old_keys:
-                    if category not in newly_added:
-                        newly_added[category] = {}
-                    newly_added[category][entity_name] = entity_info
+            # Set difference on the key views; the comprehension then keeps
+            # the original entity order
+            new_keys = new_items.keys() - all_old_keys
+            if new_keys:
+                newly_added[category] = {
+                    entity_name: entity_info
+                    for entity_name, entity_info in new_items.items()
+                    if entity_name in new_keys
+                }
 
         return newly_added
     
@@ -1803,34 +2308,44 @@ class DatabaseManager:
 
         self.logger.info(f"We will update '{old_translation}' for '{new_translation}'...")
 
+        # Every casing of each replacement word, indexed by _case_style(),
+        # worked out once instead of on every match
+        cased_new_words = [(w.upper(), w.capitalize(), w.lower(), w) for w in new_translation.split()]
+
         def match_case(match):
-            matched_text = match.group()
-            old_words = matched_text.split()
-            new_words = new_translation.split()
+            old_words = match.group().split()
             
             # Use zip_longest to handle mismatched word counts
-            transformed_words = []
-            for old_w, new_w in zip_longest(old_words, new_words, fillvalue=""):
-                if old_w.isupper():
-                    transformed_words.append(new_w.upper())
-                elif old_w.istitle():
-                    transformed_words.append(new_w.capitalize())
-                elif old_w.islower():
-                    transformed_words.append(new_w.lower())
-                else:
-                    transformed_words.append(new_w)  # Preserve as is for unknown cases
+            transformed_words = [
+                cased[_case_style(old_w or "")] if cased else ""
+                for old_w, cased in zip_longest(old_words, cased_new_words)
+            ]
             
             return " ".join(transformed_words).strip()
         
-        # Compile pattern for case-insensitive search
-        pattern = re.compile(re.escape(old_translation), re.IGNORECASE)
-        for i in range(len(translated_text)):
-            translated_text[i] = pattern.sub(match_case, translated_text[i])
+        # Case-insensitive pattern, compiled once per distinct old translation
+        pattern = _compile_ci(old_translation)
+
+        # One sub() over the whole chapter; the NUL separator can't be part
+        # of a match, so nothing is replaced across line boundaries
+        joined = '\0'.join(translated_text)
+        if joined.count('\0') == len(translated_text) - 1:
+            translated_text[:] = pattern.sub(match_case, joined).split('\0')
+        else:
+            # Lines already contain NULs; fall back to line by line
+            for i in range(len(translated_text)):
+                translated_text[i] = pattern.sub(match_case, translated_text[i])
         
         return translated_text
     
     def _normalize_text(self, text):
         """Normalize text for consistent comparison"""
+        # Entity keys are short and repeat across chapters: memoize those.
+        # Chapter text is long and seen once, so only take the quick check path
+        if len(text) <= 256:
+            return _normalize_short(text)
+        if unicodedata.is_normalized('NFC', text):
+            return text
         return unicodedata.normalize('NFC', text)
     
     def add_entity(self, category, untranslated, translation, book_id=None, last_chapter=None, incorrect_translation=None, gender=None, origin_chapter=None, note=None):
@@ -1851,30 +2366,28 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
             
-            # Check if entity already exists for this book (regardless of category)
+            # Check if entity already exists for this book (regardless of category),
+            # fetching the fields an update preserves in the same query
             if book_id is not None:
                 cursor.execute('''
-                SELECT id, origin_chapter, category FROM entities
+                SELECT id, origin_chapter, category, gender, note FROM entities
                 WHERE untranslated = ? AND book_id = ?
                 ''', (untranslated, book_id))
             else:
                 cursor.execute('''
-                SELECT id, origin_chapter, category FROM entities
+                SELECT id, origin_chapter, category, gender, note FROM entities
                 WHERE untranslated = ? AND book_id IS NULL
                 ''', (untranslated,))
 
             same_cat = cursor.fetchone()
             if same_cat:
-                # Update existing — preserve origin_chapter, gender, and note if not explicitly provided
+                # Update existing in place — preserve origin_chapter, gender, and note if not explicitly provided
                 existing_id = same_cat[0]
                 effective_origin = origin_chapter if origin_chapter is not None else (same_cat[1] if same_cat[1] is not None else last_chapter)
-                if gender is None or note is None:
-                    cursor.execute('SELECT gender, note FROM entities WHERE id = ?', (existing_id,))
-                    existing = cursor.fetchone()
-                    if gender is None and existing:
-                        gender = existing[0]
-                    if note is None and existing:
-                        note = existing[1]
+                if gender is None:
+                    gender = same_cat[3]
+                if note is None:
+                    note = same_cat[4]
                 cursor.execute('''
                 UPDATE entities
                 SET category = ?, translation = ?, last_chapter = ?, incorrect_translation = ?, gender = ?, origin_chapter = ?, note = ?
@@ -2049,37 +2562,39 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
             
-            # Check if entity exists in the source category
-            cursor.execute('''
-            SELECT translation, last_chapter, incorrect_translation, gender 
-            FROM entities 
-            WHERE category = ? AND untranslated = ?
-            ''', (old_category, untranslated))
-            
-            entity_data = cursor.fetchone()
-            if not entity_data:
-                self.logger.warning(f"Entity '{untranslated}' not found in category '{old_category}'")
-                conn.close()
-                return False
-            
-            # Check if entity already exists in the target category
-            cursor.execute('''
-            SELECT id FROM entities 
-            WHERE category = ? AND untranslated = ?
-            ''', (new_category, untranslated))
-            
-            if cursor.fetchone():
-                self.logger.warning(f"Entity '{untranslated}' already exists in target category '{new_category}'")
+            # Update the category unless the entity already exists in the
+            # target category, in one statement
+            if self.backend.name == 'mysql':
+                # MySQL can't select from the table being updated in a
+                # subquery, so anti-join against the target category instead
+                cursor.execute('''
+                UPDATE entities e
+                LEFT JOIN entities t ON t.category = ? AND t.untranslated = ?
+                SET e.category = ?
+                WHERE e.category = ? AND e.untranslated = ? AND t.id IS NULL
+                ''', (new_category, untranslated, new_category, old_category, untranslated))
+            else:
+                cursor.execute('''
+                UPDATE entities 
+                SET category = ?
+                WHERE category = ? AND untranslated = ?
+                AND NOT EXISTS (SELECT 1 FROM entities WHERE category = ? AND untranslated = ?)
+                ''', (new_category, old_category, untranslated, new_category, untranslated))
+            
+            if cursor.rowcount <= 0:
+                # Nothing moved: tell a missing source apart from a taken target
+                cursor.execute('''
+                SELECT 1 FROM entities 
+                WHERE category = ? AND untranslated = ?
+                LIMIT 1
+                ''', (old_category, untranslated))
+                if cursor.fetchone():
+                    self.logger.warning(f"Entity '{untranslated}' already exists in target category '{new_category}'")
+                else:
+                    self.logger.warning(f"Entity '{untranslated}' not found in category '{old_category}'")
                 conn.close()
                 return False
             
-            # Update the category
-            cursor.execute('''
-            UPDATE entities 
-            SET category = ?
-            WHERE category = ? AND untranslated = ?
-            ''', (new_category, old_category, untranslated))
-            
             conn.commit()
             conn.close()
             
@@ -2135,13 +2650,14 @@ class DatabaseManager:
             self.logger.error(f"Error finding entity by translation in database: {e}")
             return None
     
-    def export_to_json(self, filepath):
+    def export_to_json(self, filepath, pretty=True):
         """
         Export the entire database to a JSON file (for compatibility with original code).
+        Pass pretty=False for compact output when nobody will read the file by hand.
         """
         try:
             # Export current in-memory cache to JSON
-            self.save_json_file(filepath, self.entities)
+            self.save_json_file(filepath, self.entities, pretty=pretty)
             return True
         except Exception as e:
             self.logger.error(f"Error exporting entities to JSON: {e}")
@@ -2166,25 +2682,40 @@ class DatabaseManager:
             if clear_first:
                 cursor.execute('DELETE FROM entities')
             
-            # Import each entity
-            count = 0
-            for category, entities in json_data.items():
-                for untranslated, entity_data in entities.items():
-                    translation = entity_data.get('translation', '')
-                    last_chapter = entity_data.get('last_chapter', '')
-                    incorrect_translation = entity_data.get('incorrect_translation', None)
-                    gender = entity_data.get('gender', None)
-                    
-                    cursor.execute(self.backend.upsert_entity_sql(),
-                        (category, untranslated, translation, last_chapter, incorrect_translation, gender))
-                    count += 1
+            # Import every entity in one batch, as the strings the TEXT columns
+            # hold, so the cache write-through below matches a reload
+            rows = [
+                (category, untranslated,
+                 _as_text(entity_data.get('translation', '')),
+                 _as_text(entity_data.get('last_chapter', '')),
+                 _as_text(entity_data.get('incorrect_translation', None)),
+                 _as_text(entity_data.get('gender', None)))
+                for category, entities in json_data.items()
+                for untranslated, entity_data in entities.items()
+            ]
+            count = len(rows)
+            if self.backend.name == 'sqlite':
+                # Bind the whole batch as one JSON parameter and let SQLite
+                # unpack it, rather than binding six parameters per row
+                cursor.execute(self.backend.upsert_entities_json_sql(), (_json_dumps(rows),))
+            else:
+                cursor.executemany(self.backend.upsert_entity_sql(), rows)
             
             conn.commit()
             conn.close()
             self.logger.info(f"Imported {count} entities from JSON file '{filepath}'")
             
-            # Refresh the in-memory cache
-            self._load_entities()
+            # Write the imported rows through to the in-memory cache instead
+            # of reloading every entity from the database
+            if clear_first:
+                self.entities = {cat: {} for cat in DEFAULT_CATEGORIES}
+            for category, untranslated, translation, last_chapter, incorrect_translation, gender in rows:
+                entity_data = {"translation": translation, "last_chapter": last_chapter}
+                if incorrect_translation:
+                    entity_data["incorrect_translation"] = incorrect_translation
+                if gender:
+                    entity_data["gender"] = gender
+                self.entities.setdefault(category, {})[untranslated] = entity_data
             return True
             
         except Exception as e:
@@ -2238,36 +2769,38 @@ class DatabaseManager:
             query += ' ORDER BY category, untranslated'
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
 
-            # Process results
+            # Build the result straight off the cursor, without materializing
+            # every row first
             entities = default_entities.copy()
-            for row in rows:
-                cat, untranslated, translation, last_chapter, incorrect_translation, gender, entity_book_id, note = row
-
-                # Initialize category if needed
-                entities.setdefault(cat, {})
-
-                # Create entity entry
-                entity_data = {
-                    "translation": translation,
-                    "last_chapter": last_chapter,
-                    "category": cat
-                }
-
-                # Add optional attributes if they exist
-                if incorrect_translation:
-                    entity_data["incorrect_translation"] = incorrect_translation
-                if gender:
-                    entity_data["gender"] = gender
-                if entity_book_id:
-                    entity_data["book_id"] = entity_book_id
-                if note:
-                    entity_data["note"] = note
-
-                # Add to our entities dictionary
-                entities[cat][untranslated] = entity_data
+            try:
+                for cat, untranslated, translation, last_chapter, incorrect_translation, gender, entity_book_id, note in cursor:
+                    bucket = entities.get(cat)
+                    if bucket is None:
+                        # Initialize category if needed
+                        bucket = entities[cat] = {}
+
+                    # Create entity entry
+                    entity_data = {
+                        "translation": translation,
+                        "last_chapter": last_chapter,
+                        "category": cat
+                    }
+
+                    # Add optional attributes if they exist
+                    if incorrect_translation:
+                        entity_data["incorrect_translation"] = incorrect_translation
+                    if gender:
+                        entity_data["gender"] = gender
+                    if entity_book_id:
+                        entity_data["book_id"] = entity_book_id
+                    if note:
+                        entity_data["note"] = note
+
+                    # Add to our entities dictionary
+                    bucket[untranslated] = entity_data
+            finally:
+                conn.close()
 
             self.logger.debug(f"Loaded {sum(len(cat) for cat in entities.values())} entities for review")
             return entities
@@ -2358,8 +2891,29 @@ class DatabaseManager:
             conn = self.backend.get_connection()
             cursor = conn.cursor()
 
-            # Search in both untranslated and translated content
-            if book_id is not None:
+            # Search in both untranslated and translated content.  The trigram
+            # index only answers phrases of 3+ characters; shorter ones scan
+            if self._chapter_fts and len(untranslated_text) >= 3:
+                phrase = '"' + untranslated_text.replace('"', '""') + '"'
+                if book_id is not None:
+                    cursor.execute('''
+                    SELECT c.id, c.book_id, c.chapter_number, c.title, b.title as book_title
+                    FROM chapters_fts f
+                    JOIN chapters c ON c.id = f.rowid
+                    JOIN books b ON c.book_id = b.id
+                    WHERE chapters_fts MATCH ? AND c.book_id = ?
+                    ORDER BY c.chapter_number
+                    ''', (phrase, book_id))
+                else:
+                    cursor.execute('''
+                    SELECT c.id, c.book_id, c.chapter_number, c.title, b.title as book_title
+                    FROM chapters_fts f
+                    JOIN chapters c ON c.id = f.rowid
+                    JOIN books b ON c.book_id = b.id
+                    WHERE chapters_fts MATCH ?
+                    ORDER BY b.title, c.chapter_number
+                    ''', (phrase,))
+            elif book_id is not None:
                 cursor.execute('''
                 SELECT c.id, c.book_id, c.chapter_number, c.title, b.title as book_title
                 FROM chapters c
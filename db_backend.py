@@ -12,6 +12,9 @@ when DB_BACKEND=mysql is configured.
 
 import os
 import sqlite3
+import threading
+import time
+import weakref
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +26,8 @@ class _MySQLCursorWrapper:
 
     def __init__(self, real_cursor):
         self._cursor = real_cursor
+        # Default fetchmany() batch size, as on sqlite3 cursors
+        self.arraysize = 1
 
     # Translate ? → %s in the SQL string.  This is safe because
     # properly parameterised SQL never contains literal '?' — values
@@ -43,7 +48,7 @@ class _MySQLCursorWrapper:
 
     def fetchmany(self, size=None):
         if size is None:
-            return self._cursor.fetchmany()
+            size = self.arraysize
         return self._cursor.fetchmany(size)
 
     @property
@@ -82,6 +87,13 @@ class _MySQLDictCursorWrapper(_MySQLCursorWrapper):
         cols = [d[0] for d in self._cursor.description]
         return [dict(zip(cols, r)) for r in rows]
 
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(size)
+        if not rows:
+            return rows
+        cols = [d[0] for d in self._cursor.description]
+        return [dict(zip(cols, r)) for r in rows]
+
 
 # ---------------------------------------------------------------------------
 # Connection wrappers
@@ -135,21 +147,186 @@ class _MySQLConnectionWrapper:
         return cur
 
 
+class _SQLiteConnectionSlot:
+    """A thread's long-lived sqlite3 connection plus its checkout depth."""
+
+    __slots__ = ('conn', 'depth', 'last_used', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.depth = 0
+        self.last_used = time.monotonic()
+
+
+class _PooledSQLiteConnection:
+    """
+    Handle on the calling thread's pooled sqlite3 connection.
+
+    Behaves like a sqlite3 connection for the rest of the codebase, but
+    close() hands the connection back to the pool instead of closing it.
+    row_factory is kept per handle and applied to each cursor it creates,
+    so one caller's setting never leaks into the next.
+    """
+
+    def __init__(self, backend, slot):
+        self._backend = backend
+        self._slot = slot
+        self._conn = slot.conn
+        self._closed = False
+        self.row_factory = None
+
+    def _check_open(self):
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+    def cursor(self):
+        self._check_open()
+        cursor = self._conn.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor
+
+    def execute(self, *args):
+        """Convenience — matches sqlite3.Connection.execute()."""
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args):
+        return self.cursor().executemany(*args)
+
+    def executescript(self, script):
+        return self.cursor().executescript(script)
+
+    def commit(self):
+        self._check_open()
+        self._conn.commit()
+
+    def rollback(self):
+        self._check_open()
+        self._conn.rollback()
+
+    @property
+    def in_transaction(self):
+        return self._conn.in_transaction
+
+    def close(self):
+        """Release the connection back to the pool (idempotent)."""
+        if not self._closed:
+            self._closed = True
+            self._backend._release(self._slot)
+
+    def __enter__(self):
+        self._check_open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Same contract as sqlite3.Connection: commit or roll back, don't close
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def __del__(self):
+        # Callers that bail out on an exception often never reach close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 # ---------------------------------------------------------------------------
 # Backend implementations
 # ---------------------------------------------------------------------------
 
+# Per-connection tuning.  WAL (set once, it persists in the database file)
+# lets readers run alongside a writer; with WAL, synchronous=NORMAL only
+# syncs at checkpoints instead of on every commit.  Foreign keys are on for
+# every connection: pooled connections are shared, so a per-call
+# enable_foreign_keys() would otherwise stick for whoever came next.
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys = ON;"
+    "PRAGMA synchronous = NORMAL;"
+    "PRAGMA temp_store = MEMORY;"
+    "PRAGMA cache_size = -20000;"
+    "PRAGMA mmap_size = 268435456;"
+)
+
+
 class SQLiteBackend:
-    """SQLite database backend (default)."""
+    """
+    SQLite database backend (default).
+
+    Each thread keeps one long-lived connection; get_connection() returns a
+    handle on it and the handle's close() releases it.  Handles taken while
+    another is open on the same thread (nested calls) share the connection,
+    and any transaction still open when the outermost handle is released is
+    rolled back, as closing a plain connection would have done.
+    """
 
     name = 'sqlite'
 
+    # Pooled connections unused for this long are reopened on next checkout
+    IDLE_TIMEOUT = 300
+
+    # DELETE/INSERT ... RETURNING needs SQLite 3.35+; older libraries fall
+    # back to a SELECT alongside the write
+    supports_returning = sqlite3.sqlite_version_info >= (3, 35, 0)
+
     def __init__(self, db_path):
         self.db_path = db_path
+        self._wal_enabled = False
+        self._local = threading.local()
+        self._slots = weakref.WeakSet()
+        self._slots_lock = threading.Lock()
+
+    def _connect(self):
+        """Open a sqlite3 connection with the standard PRAGMAs applied."""
+        # check_same_thread=False only so close_all() can run from any thread;
+        # each connection is otherwise used by the thread that opened it
+        # A larger statement cache pays off now that connections are long-lived
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        if not self._wal_enabled:
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._wal_enabled = True
+        conn.executescript(_SQLITE_PRAGMAS)
+        return conn
 
     def get_connection(self):
-        """Return a plain sqlite3 connection."""
-        return sqlite3.connect(self.db_path)
+        """Return a handle on this thread's pooled sqlite3 connection."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None or slot.conn is None:
+            slot = _SQLiteConnectionSlot(self._connect())
+            self._local.slot = slot
+            with self._slots_lock:
+                self._slots.add(slot)
+        elif slot.depth == 0:
+            if time.monotonic() - slot.last_used > self.IDLE_TIMEOUT:
+                slot.conn.close()
+                slot.conn = self._connect()
+            elif slot.conn.in_transaction:
+                # Left open by a caller whose handle is still alive somewhere
+                slot.conn.rollback()
+        slot.depth += 1
+        return _PooledSQLiteConnection(self, slot)
+
+    def _release(self, slot):
+        slot.depth -= 1
+        if slot.depth <= 0:
+            slot.depth = 0
+            slot.last_used = time.monotonic()
+            if slot.conn is not None and slot.conn.in_transaction:
+                slot.conn.rollback()
+
+    def close_all(self):
+        """Close every pooled connection (e.g. at shutdown)."""
+        with self._slots_lock:
+            slots = list(self._slots)
+        for slot in slots:
+            conn, slot.conn = slot.conn, None
+            if conn is not None:
+                conn.close()
 
     # -- Dialect helpers ----------------------------------------------------
 
@@ -162,6 +339,10 @@ class SQLiteBackend:
     def enable_foreign_keys(self, conn):
         conn.execute("PRAGMA foreign_keys = ON")
 
+    def is_foreign_key_error(self, exc):
+        """True if *exc* is a foreign key violation (e.g. a missing parent book)."""
+        return isinstance(exc, sqlite3.IntegrityError) and 'FOREIGN KEY' in str(exc)
+
     def upsert_entity_sql(self):
         return (
             "INSERT INTO entities (category, untranslated, translation, last_chapter, incorrect_translation, gender) "
@@ -172,6 +353,61 @@ class SQLiteBackend:
             "gender = excluded.gender"
         )
 
+    def upsert_entities_json_sql(self):
+        """
+        upsert_entity_sql() for a whole batch in one statement.
+
+        Takes a single parameter: a JSON array of
+        [category, untranslated, translation, last_chapter, incorrect_translation, gender]
+        rows, unpacked with json_each.  SQLite only.
+        """
+        return (
+            "INSERT INTO entities (category, untranslated, translation, last_chapter, incorrect_translation, gender) "
+            "SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]'), "
+            "json_extract(value, '$[3]'), json_extract(value, '$[4]'), json_extract(value, '$[5]') "
+            "FROM json_each(?) WHERE true "
+            "ON CONFLICT(book_id, untranslated) DO UPDATE SET "
+            "category = excluded.category, translation = excluded.translation, "
+            "last_chapter = excluded.last_chapter, incorrect_translation = excluded.incorrect_translation, "
+            "gender = excluded.gender"
+        )
+
+    def upsert_book_entity_sql(self):
+        # Book-scoped rows only: NULL book_ids never conflict under UNIQUE(book_id, untranslated)
+        return (
+            "INSERT INTO entities (category, untranslated, translation, last_chapter, incorrect_translation, "
+            "gender, book_id, note) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(book_id, untranslated) DO UPDATE SET "
+            "category = excluded.category, translation = excluded.translation, "
+            "last_chapter = excluded.last_chapter, incorrect_translation = excluded.incorrect_translation, "
+            "gender = excluded.gender, note = excluded.note"
+        )
+
+    def upsert_chapter_sql(self, returning_id=False):
+        sql = (
+            "INSERT INTO chapters (book_id, chapter_number, title, untranslated_content, translated_content, "
+            "summary, translation_date, translation_model) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(book_id, chapter_number) DO UPDATE SET "
+            "title = excluded.title, untranslated_content = excluded.untranslated_content, "
+            "translated_content = excluded.translated_content, summary = excluded.summary, "
+            "translation_date = excluded.translation_date, translation_model = excluded.translation_model"
+        )
+        return sql + " RETURNING id" if returning_id else sql
+
+    def insert_or_get_book_sql(self):
+        # The no-op update makes RETURNING report the existing row on conflict;
+        # a created_date equal to the one passed in means the row is new.
+        # Without RETURNING support the caller reads the row back by title.
+        sql = (
+            "INSERT INTO books (title, author, language, description, created_date, modified_date, "
+            "source_language, target_language) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(title) DO UPDATE SET title = excluded.title"
+        )
+        return sql + " RETURNING id, created_date" if self.supports_returning else sql
+
     def upsert_token_ratio_sql(self):
         return (
             "INSERT INTO token_ratios (book_id, total_input_chars, total_output_tokens, sample_count) "
@@ -198,12 +434,18 @@ class SQLiteBackend:
         """Return list of DDL statements for SQLite."""
         return _COMMON_DDL_SQLITE
 
+    def chapter_fts_ddl(self):
+        """Return DDL for the trigram full-text index over chapter contents and its sync triggers."""
+        return _CHAPTER_FTS_DDL_SQLITE
+
 
 class MySQLBackend:
     """MySQL / MariaDB database backend (optional)."""
 
     name = 'mysql'
 
+    supports_returning = False
+
     def __init__(self, host, user, password, database, port=3306):
         # Defer import — never fails at module level
         try:
@@ -231,6 +473,10 @@ class MySQLBackend:
         raw = mysql.connector.connect(**self._connect_args)
         return _MySQLConnectionWrapper(raw)
 
+    def close_all(self):
+        # Connections are per call and closed by their callers
+        pass
+
     # -- Dialect helpers ----------------------------------------------------
 
     def get_table_columns(self, conn, table_name):
@@ -247,6 +493,11 @@ class MySQLBackend:
         # InnoDB has foreign keys on by default — nothing to do
         pass
 
+    def is_foreign_key_error(self, exc):
+        """True if *exc* is a foreign key violation (e.g. a missing parent book)."""
+        # ER_NO_REFERENCED_ROW_2: "Cannot add or update a child row"
+        return getattr(exc, 'errno', None) == 1452
+
     def upsert_entity_sql(self):
         return (
             "INSERT INTO entities (category, untranslated, translation, last_chapter, incorrect_translation, gender) "
@@ -257,6 +508,41 @@ class MySQLBackend:
             "gender = VALUES(gender)"
         )
 
+    def upsert_book_entity_sql(self):
+        # Book-scoped rows only: NULL book_ids never conflict under uq_entity
+        return (
+            "INSERT INTO entities (category, untranslated, translation, last_chapter, incorrect_translation, "
+            "gender, book_id, note) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON DUPLICATE KEY UPDATE "
+            "category = VALUES(category), translation = VALUES(translation), "
+            "last_chapter = VALUES(last_chapter), incorrect_translation = VALUES(incorrect_translation), "
+            "gender = VALUES(gender), note = VALUES(note)"
+        )
+
+    def upsert_chapter_sql(self, returning_id=False):
+        # id = LAST_INSERT_ID(id) makes lastrowid report the existing row's ID
+        # on update, so no RETURNING clause is needed
+        return (
+            "INSERT INTO chapters (book_id, chapter_number, title, untranslated_content, translated_content, "
+            "summary, translation_date, translation_model) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON DUPLICATE KEY UPDATE "
+            "title = VALUES(title), untranslated_content = VALUES(untranslated_content), "
+            "translated_content = VALUES(translated_content), summary = VALUES(summary), "
+            "translation_date = VALUES(translation_date), translation_model = VALUES(translation_model), "
+            "id = LAST_INSERT_ID(id)"
+        )
+
+    def insert_or_get_book_sql(self):
+        # lastrowid is the existing ID on conflict; rowcount is 1 only for a new row
+        return (
+            "INSERT INTO books (title, author, language, description, created_date, modified_date, "
+            "source_language, target_language) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)"
+        )
+
     def upsert_token_ratio_sql(self):
         return (
             "INSERT INTO token_ratios (book_id, total_input_chars, total_output_tokens, sample_count) "
@@ -288,6 +574,10 @@ class MySQLBackend:
         """Return list of DDL statements for MySQL."""
         return _COMMON_DDL_MYSQL
 
+    def chapter_fts_ddl(self):
+        """No full-text index on MySQL; chapter searches there stay on LIKE."""
+        return []
+
 
 # ---------------------------------------------------------------------------
 # Table DDL
@@ -306,9 +596,15 @@ _COMMON_DDL_SQLITE = [
         book_id INTEGER,
         UNIQUE(book_id, untranslated)
     )''',
-    'CREATE INDEX IF NOT EXISTS idx_category ON entities(category)',
+    # (category, untranslated) serves the category moves and deletes as well
+    # as plain category filters, and (book_id, category) the per-book review
+    # listing; they supersede the single-column category/book_id indexes
+    'CREATE INDEX IF NOT EXISTS idx_entities_cat_untrans ON entities(category, untranslated)',
+    'DROP INDEX IF EXISTS idx_category',
     'CREATE INDEX IF NOT EXISTS idx_untranslated ON entities(untranslated)',
-    'CREATE INDEX IF NOT EXISTS idx_book_id ON entities(book_id)',
+    'CREATE INDEX IF NOT EXISTS idx_entities_translation ON entities(translation)',
+    'CREATE INDEX IF NOT EXISTS idx_entities_book_cat ON entities(book_id, category)',
+    'DROP INDEX IF EXISTS idx_book_id',
 
     # books
     '''CREATE TABLE IF NOT EXISTS books (
@@ -340,7 +636,9 @@ _COMMON_DDL_SQLITE = [
         FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE
     )''',
     'CREATE INDEX IF NOT EXISTS idx_chapters_book_id ON chapters(book_id)',
-    'CREATE INDEX IF NOT EXISTS idx_chapter_number ON chapters(chapter_number)',
+    # chapter_number is never queried without book_id, and UNIQUE(book_id,
+    # chapter_number) already indexes that pair
+    'DROP INDEX IF EXISTS idx_chapter_number',
 
     # queue
     '''CREATE TABLE IF NOT EXISTS queue (
@@ -356,7 +654,11 @@ _COMMON_DDL_SQLITE = [
         retranslation_reason TEXT,
         FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE
     )''',
-    'CREATE INDEX IF NOT EXISTS idx_queue_book_id ON queue(book_id)',
+    # (book_id, position) serves per-book listing in queue order and also
+    # covers plain book_id lookups, so the single-column index is dropped
+    'CREATE INDEX IF NOT EXISTS idx_queue_book_position ON queue(book_id, position)',
+    'DROP INDEX IF EXISTS idx_queue_book_id',
+    'CREATE INDEX IF NOT EXISTS idx_queue_book_chapter ON queue(book_id, chapter_number)',
     'CREATE INDEX IF NOT EXISTS idx_queue_position ON queue(position)',
     'CREATE UNIQUE INDEX IF NOT EXISTS idx_queue_position_unique ON queue(position)',
 
@@ -450,6 +752,34 @@ _COMMON_DDL_SQLITE = [
     'CREATE INDEX IF NOT EXISTS idx_recommendations_status ON recommendations(status)',
 ]
 
+# External-content FTS5 table over chapters(untranslated_content,
+# translated_content).  The trigram tokenizer turns MATCH on a quoted phrase
+# into a case-insensitive substring search (unicode61 would treat a whole run
+# of Han characters as one token).  Only content changes touch the index.
+_CHAPTER_FTS_DDL_SQLITE = [
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS chapters_fts USING fts5(
+        untranslated_content, translated_content,
+        content='chapters', content_rowid='id', tokenize='trigram'
+    )''',
+    '''CREATE TRIGGER IF NOT EXISTS chapters_fts_ai AFTER INSERT ON chapters BEGIN
+        INSERT INTO chapters_fts(rowid, untranslated_content, translated_content)
+        VALUES (new.id, new.untranslated_content, new.translated_content);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS chapters_fts_ad AFTER DELETE ON chapters BEGIN
+        INSERT INTO chapters_fts(chapters_fts, rowid, untranslated_content, translated_content)
+        VALUES ('delete', old.id, old.untranslated_content, old.translated_content);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS chapters_fts_au
+    AFTER UPDATE OF untranslated_content, translated_content ON chapters BEGIN
+        INSERT INTO chapters_fts(chapters_fts, rowid, untranslated_content, translated_content)
+        VALUES ('delete', old.id, old.untranslated_content, old.translated_content);
+        INSERT INTO chapters_fts(rowid, untranslated_content, translated_content)
+        VALUES (new.id, new.untranslated_content, new.translated_content);
+    END''',
+    # Index the chapters that predate the table
+    "INSERT INTO chapters_fts(chapters_fts) VALUES('rebuild')",
+]
+
 _COMMON_DDL_MYSQL = [
     # entities
     '''CREATE TABLE IF NOT EXISTS entities (
@@ -466,6 +796,9 @@ _COMMON_DDL_MYSQL = [
     'CREATE INDEX idx_category ON entities(category)',
     'CREATE INDEX idx_untranslated ON entities(untranslated(255))',
     'CREATE INDEX idx_book_id ON entities(book_id)',
+    'CREATE INDEX idx_entities_cat_untrans ON entities(category, untranslated(255))',
+    'CREATE INDEX idx_entities_translation ON entities(translation(255))',
+    'CREATE INDEX idx_entities_book_cat ON entities(book_id, category)',
 
     # books
     '''CREATE TABLE IF NOT EXISTS books (
@@ -497,7 +830,6 @@ _COMMON_DDL_MYSQL = [
         FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci''',
     'CREATE INDEX idx_chapters_book_id ON chapters(book_id)',
-    'CREATE INDEX idx_chapter_number ON chapters(chapter_number)',
 
     # queue
     '''CREATE TABLE IF NOT EXISTS queue (
@@ -516,6 +848,8 @@ _COMMON_DDL_MYSQL = [
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci''',
     'CREATE INDEX idx_queue_book_id ON queue(book_id)',
     'CREATE INDEX idx_queue_position ON queue(position)',
+    'CREATE INDEX idx_queue_book_position ON queue(book_id, position)',
+    'CREATE INDEX idx_queue_book_chapter ON queue(book_id, chapter_number)',
 
     # token_ratios
     '''CREATE TABLE IF NOT EXISTS token_ratios (
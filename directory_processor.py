@@ -2,19 +2,28 @@
 Directory Processor Module for Translator Application.
 Processes a directory of text files and adds them to the translation queue.
 """
+import fnmatch
+import glob
 import os
 import re
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple
 
+# Chapter number in a file name: "chapter 12", "ch_12", "第12", or a leading "12"
+_CHAPTER_NUMBER_RE = re.compile(r'(?:chapter|ch|第)[\s_-]*(\d+)|^(\d+)', re.IGNORECASE)
+
 
 class DirectoryProcessor:
     """
     A class to process directories containing text files and add them to the translation queue.
     """
     
+    # Upper bound on threads reading chapter files at once
+    MAX_READ_WORKERS = 8
+    
     def __init__(self, config, logger, db_manager):
         """
         Initialize the directory processor.
@@ -44,29 +53,48 @@ class DirectoryProcessor:
         if not os.path.exists(directory_path) or not os.path.isdir(directory_path):
             return False, 0, f"Directory not found: {directory_path}"
         
-        # Get list of files matching pattern
-        import glob
-        file_paths = glob.glob(os.path.join(directory_path, file_pattern))
-        
-        # Filter out directories
-        file_paths = [path for path in file_paths if os.path.isfile(path)]
+        # Get list of files matching pattern, in one scandir pass (DirEntry
+        # caches the is_file()/stat() results used for sorting).  Like glob,
+        # hidden files only match a pattern that itself starts with a dot
+        if os.path.dirname(file_pattern):
+            # Patterns reaching into subdirectories (e.g. "vol1/*.txt") need glob
+            file_paths = glob.glob(os.path.join(directory_path, file_pattern))
+            entries = [
+                (path, os.path.basename(path), os.path.getmtime(path))
+                for path in file_paths
+                if os.path.isfile(path)  # Filter out directories
+            ]
+        else:
+            match_hidden = file_pattern.startswith('.')
+            with os.scandir(directory_path) as it:
+                entries = [
+                    (entry.path, entry.name, entry.stat().st_mtime) for entry in it
+                    if (match_hidden or not entry.name.startswith('.'))
+                    and fnmatch.fnmatch(entry.name, file_pattern)
+                    and entry.is_file()  # Filter out directories
+                ]
         
-        if not file_paths:
+        if not entries:
             return False, 0, f"No files found matching pattern '{file_pattern}' in {directory_path}"
         
         # Sort files based on strategy
-        sorted_files = self._sort_files(file_paths, sort_strategy)
+        sorted_files = self._sort_files(entries, sort_strategy)
+        
+        # Read the files concurrently (file reads release the GIL); map()
+        # hands the results back in sorted order
+        workers = min(self.MAX_READ_WORKERS, len(sorted_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contents = list(executor.map(self._read_file, (file_path for file_path, _ in sorted_files)))
         
         # Process each file and add to queue
         chapters = []
-        for i, (file_path, metadata) in enumerate(sorted_files, 1):
+        for i, ((file_path, metadata), content) in enumerate(zip(sorted_files, contents), 1):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if isinstance(content, Exception):
+                    raise content
                 
-                # Extract filename for title
-                filename = os.path.basename(file_path)
-                title = os.path.splitext(filename)[0]
+                # Extract filename for title (name already taken from the DirEntry)
+                title = os.path.splitext(metadata["name"])[0]
                 
                 # Determine chapter number
                 chapter_number = metadata.get("chapter_number", i)
@@ -92,12 +120,21 @@ class DirectoryProcessor:
         else:
             return False, 0, "No files were successfully processed"
     
-    def _sort_files(self, file_paths, sort_strategy):
+    @staticmethod
+    def _read_file(file_path):
+        """Return the file's text, or the exception raised while reading it."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception as e:
+            return e
+    
+    def _sort_files(self, entries, sort_strategy):
         """
         Sort files based on the specified strategy.
         
         Args:
-            file_paths: List of file paths
+            entries: List of (file_path, name, modified_time) tuples
             sort_strategy: Strategy for ordering ("auto", "name", "modified", "none")
             
         Returns:
@@ -106,14 +143,14 @@ class DirectoryProcessor:
         files_with_metadata = []
         
         # Gather metadata for each file
-        for file_path in file_paths:
+        for file_path, name, modified_time in entries:
             metadata = {
-                "modified_time": os.path.getmtime(file_path),
-                "name": os.path.basename(file_path)
+                "modified_time": modified_time,
+                "name": name
             }
             
             # Try to extract chapter number from filename
-            chapter_match = re.search(r'(?:chapter|ch|第)[\s_-]*(\d+)|^(\d+)', os.path.basename(file_path), re.IGNORECASE)
+            chapter_match = _CHAPTER_NUMBER_RE.search(name)
             if chapter_match:
                 # Use the first matching group that captured something
                 chapter_number = next(g for g in chapter_match.groups() if g is not None)
@@ -164,24 +201,24 @@ class DirectoryProcessor:
             self.logger.error("book_id is required for adding chapters to queue")
             return 0
 
-        added_count = 0
+        items = []
         for chapter in chapters:
             content = chapter['content']
             content_lines = content.split('\n') if isinstance(content, str) else content
+            items.append({
+                'book_id': book_id,
+                'content': content_lines,
+                'title': chapter['title'],
+                'chapter_number': chapter['number'],
+                'source': chapter['file_path'],
+            })
 
-            # Add to database queue
-            queue_item_id = self.db_manager.add_to_queue(
-                book_id=book_id,
-                content=content_lines,
-                title=chapter['title'],
-                chapter_number=chapter['number'],
-                source=chapter['file_path']
-            )
-
-            if queue_item_id:
-                added_count += 1
-            else:
-                self.logger.error(f"Failed to add chapter {chapter['number']} to queue")
+        # Add to database queue in one transaction
+        queue_item_ids = self.db_manager.add_many_to_queue(items)
+        if queue_item_ids is None:
+            self.logger.error(f"Failed to add {len(items)} chapters to queue")
+            return 0
+        added_count = len(queue_item_ids)
 
         self.logger.info(f"Added {added_count} chapters to queue")
         return added_count
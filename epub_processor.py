@@ -354,24 +354,24 @@ class EPUBProcessor:
             self.logger.error("book_id is required for adding chapters to queue")
             return 0
 
-        added_count = 0
+        items = []
         for chapter in chapters:
             content = chapter['content']
             content_lines = content.split('\n') if isinstance(content, str) else content
+            items.append({
+                'book_id': book_id,
+                'content': content_lines,
+                'title': chapter['title'],
+                'chapter_number': chapter['number'],
+                'source': chapter.get('file_path', epub_path),
+            })
 
-            # Add to database queue
-            queue_item_id = self.db_manager.add_to_queue(
-                book_id=book_id,
-                content=content_lines,
-                title=chapter['title'],
-                chapter_number=chapter['number'],
-                source=chapter.get('file_path', epub_path)
-            )
-
-            if queue_item_id:
-                added_count += 1
-            else:
-                self.logger.error(f"Failed to add chapter {chapter['number']} to queue")
+        # Add to database queue in one transaction
+        queue_item_ids = self.db_manager.add_many_to_queue(items)
+        if queue_item_ids is None:
+            self.logger.error(f"Failed to add {len(items)} chapters to queue")
+            return 0
+        added_count = len(queue_item_ids)
 
         self.logger.info(f"Added {added_count} chapters to queue")
         return added_count
@@ -14,6 +14,14 @@ from .claude_code_provider import ClaudeCodeProvider
 class ProviderFactory:
     """Factory for creating model providers based on configuration."""
     
+    # Provider class names (as used in models.json) mapped to classes
+    _PROVIDER_CLASSES = {
+        'OpenAIProvider': OpenAIProvider,
+        'ClaudeProvider': ClaudeProvider,
+        'GeminiProvider': GeminiProvider,
+        'ClaudeCodeProvider': ClaudeCodeProvider,
+    }
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the factory with provider configuration.
@@ -109,17 +117,11 @@ class ProviderFactory:
     
     def _get_provider_class(self, class_name: str):
         """Get provider class by name."""
-        classes = {
-            'OpenAIProvider': OpenAIProvider,
-            'ClaudeProvider': ClaudeProvider,
-            'GeminiProvider': GeminiProvider,
-            'ClaudeCodeProvider': ClaudeCodeProvider,
-        }
-        
-        if class_name not in classes:
+        provider_class = self._PROVIDER_CLASSES.get(class_name)
+        if provider_class is None:
             raise ValueError(f"Unknown provider class: {class_name}")
         
-        return classes[class_name]
+        return provider_class
     
     def get_default_model(self, provider_name: str) -> Optional[str]:
         """Get the default model for a provider."""
@@ -61,8 +61,11 @@ def _get_cached(cache_conn, ip: str) -> dict | None:
 
 def _set_cached(cache_conn, ip: str, info: dict):
     cache_conn.execute(
-        "INSERT OR REPLACE INTO ip_cache (ip, hostname, city, region, country, org, cached_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        "INSERT INTO ip_cache (ip, hostname, city, region, country, org, cached_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(ip) DO UPDATE SET hostname = excluded.hostname, city = excluded.city, "
+        "region = excluded.region, country = excluded.country, org = excluded.org, "
+        "cached_at = excluded.cached_at",
         (ip, info.get("hostname"), info.get("city"), info.get("region"),
          info.get("country"), info.get("org"),
          datetime.datetime.now(datetime.timezone.utc).isoformat())
@@ -16,7 +16,7 @@ from dotenv import load_dotenv
 from epub_processor import EPUBProcessor
 from output_formatter import OutputFormatter
 from directory_processor import DirectoryProcessor
-from config import TranslationConfig
+from config import get_config
 from logger import Logger
 from database import DatabaseManager
 from translation_engine import TranslationEngine
@@ -31,7 +31,7 @@ class TranslationApp:
     
     def __init__(self, ui_type="cli"):
         # Initialize configuration
-        self.config = TranslationConfig()
+        self.config = get_config()
         
         # Set up logger
         self.logger = Logger(self.config)
@@ -613,10 +613,9 @@ class UserInterface(ABC):
             Set of untranslated entity keys that are proper nouns, or None if classification fails
         """
         import os
-        from providers import create_provider
-        from config import TranslationConfig
+        from config import get_config
 
-        config = TranslationConfig()
+        config = get_config()
         cleaning_prompt_path = os.path.join(config.script_dir, "cleaning_prompt.txt")
 
         try:
@@ -651,8 +650,7 @@ class UserInterface(ABC):
                 else:
                     model_spec = config.translation_model
 
-            provider_name, model = config.parse_model_spec(model_spec)
-            provider = create_provider(provider_name)
+            provider, model = config.get_client(model_spec)
 
             self.logger.info(f"Analyzing {len(entities)} entities with {model}...")
 
@@ -764,9 +762,8 @@ class UserInterface(ABC):
         user_prompt = json.dumps(lines_to_fix, ensure_ascii=False, indent=2)
 
         try:
-            from providers import create_provider
-            from config import TranslationConfig
-            config = TranslationConfig()
+            from config import get_config
+            config = get_config()
 
             # Build repair prompt — use the template file with language substituted
             repair_prompt_path = os.path.join(config.script_dir, "translation_repair_prompt.txt")
@@ -789,8 +786,7 @@ class UserInterface(ABC):
             else:
                 model_spec = config.translation_model
 
-            provider_name, model_name = config.parse_model_spec(model_spec)
-            provider = create_provider(provider_name)
+            provider, model_name = config.get_client(model_spec)
 
             self.logger.info(f"Repairing {len(affected_indices)} line(s) with {model_name}...")
 
@@ -448,9 +448,8 @@ def _filter_false_positives(lines: List[str], all_matches: list,
         Set of match IDs that should NOT be converted (false positives).
     """
     try:
-        from providers import create_provider
-        from config import TranslationConfig
-        config = TranslationConfig()
+        from config import get_config
+        config = get_config()
 
         # Build context dict with highlighted matches
         context = {}
@@ -474,8 +473,7 @@ def _filter_false_positives(lines: List[str], all_matches: list,
         system_prompt = _load_cleaning_prompt()
         user_prompt = json.dumps(context, ensure_ascii=False, indent=2)
 
-        provider_name, model_name = config.parse_model_spec(cleaning_model)
-        provider = create_provider(provider_name)
+        provider, model_name = config.get_client(cleaning_model)
 
         logger.info(f"Filtering {len(context)} unit match(es) with {model_name}...")
 
@@ -170,21 +170,19 @@ async def upload_batch_to_queue(
         file_entries.sort(key=lambda e: e["filename"])
 
     # Add to queue with sequential chapter numbers
-    added = 0
     base_chapter = start_chapter or 1
-    for i, entry in enumerate(file_entries):
-        chapter_num = entry["chapter_number"] if entry["chapter_number"] is not None else base_chapter + i
-        lines = entry["text"].splitlines()
-        title = os.path.splitext(entry["filename"])[0]
-        queue_id = _entity_manager.add_to_queue(
-            book_id=book_id,
-            content=lines,
-            title=title,
-            chapter_number=chapter_num,
-            source=f"upload:{entry['filename']}",
-        )
-        if queue_id:
-            added += 1
+    items = [
+        {
+            "book_id": book_id,
+            "content": entry["text"].splitlines(),
+            "title": os.path.splitext(entry["filename"])[0],
+            "chapter_number": entry["chapter_number"] if entry["chapter_number"] is not None else base_chapter + i,
+            "source": f"upload:{entry['filename']}",
+        }
+        for i, entry in enumerate(file_entries)
+    ]
+    queue_ids = _entity_manager.add_many_to_queue(items)
+    added = len(queue_ids) if queue_ids else 0
 
     return {
         "status": "ok",
@@ -207,7 +205,6 @@ async def upload_epub(
 ):
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
     from epub_processor import EPUBProcessor
-    from config import TranslationConfig
 
     if not book_id and not create_book:
         raise HTTPException(status_code=400, detail="Provide book_id or set create_book=true.")
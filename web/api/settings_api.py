@@ -81,6 +81,9 @@ async def set_api_key(provider_name: str, req: ApiKeyRequest):
 
     os.environ[env_var] = req.api_key
     _persist_env(env_var, req.api_key)
+    if _config is not None:
+        # Providers built with the old key are cached on the config
+        _config.clear_provider_cache()
     return {"status": "ok", "env_var": env_var}
 
 
@@ -206,7 +209,8 @@ async def export_json():
     tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
     tmp.close()
     try:
-        success = _entity_manager.export_to_json(tmp.name)
+        # Compact: the download is meant to be re-imported, not read
+        success = _entity_manager.export_to_json(tmp.name, pretty=False)
         if not success:
             raise HTTPException(status_code=500, detail="Export failed.")
         with open(tmp.name, "rb") as f:
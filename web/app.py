@@ -17,7 +17,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from config import TranslationConfig
+from config import get_config
 from logger import Logger
 from database import DatabaseManager
 from translation_engine import TranslationEngine
@@ -32,7 +32,7 @@ from web.auth import configure_auth, AuthMiddleware, router as auth_router
 # ------------------------------------------------------------------
 
 def create_app() -> FastAPI:
-    config = TranslationConfig()
+    config = get_config()
     logger = Logger(config)
     entity_manager = DatabaseManager(config, logger)
     translator = TranslationEngine(config, logger, entity_manager)